@@ -0,0 +1,85 @@
+import pytest
+
+from tron_ai.database.config import DatabaseConfig
+from tron_ai.database.manager import DatabaseManager
+
+
+@pytest.fixture
+async def db_manager(tmp_path):
+    manager = DatabaseManager(
+        DatabaseConfig(
+            database_url=f"sqlite+aiosqlite:///{tmp_path}/conversations.db",
+            database_path=tmp_path,
+        )
+    )
+    await manager.initialize()
+    yield manager
+    await manager.close()
+
+
+async def test_add_messages_batch_round_trips(db_manager):
+    meta = {"task_id": "t1", "root_id": "root"}
+    saved = await db_manager.add_messages_batch(
+        session_id="session",
+        messages=[
+            {"role": "agent", "content": "do the thing", "agent_name": "writer", "meta": meta, "task_id": "t1"},
+            {
+                "role": "assistant",
+                "content": "done",
+                "agent_name": "writer",
+                "tool_calls": [{"name": "search", "args": {"q": "python"}}],
+                "meta": {**meta, "result_type": "str"},
+                "task_id": "t1",
+            },
+        ],
+        agent_sessions=[{
+            "agent_name": "writer",
+            "user_query": "do the thing",
+            "agent_response": "done",
+            "tool_calls": None,
+            "execution_time_ms": None,
+            "success": True,
+            "error_message": None,
+            "meta": meta,
+        }],
+        root_id="root",
+    )
+
+    assert [message.content for message in saved] == ["do the thing", "done"]
+    assert all(message.id is not None for message in saved)
+
+    messages = await db_manager.get_messages("session")
+    assert [(m.role, m.content, m.task_id) for m in messages] == [
+        ("agent", "do the thing", "t1"),
+        ("assistant", "done", "t1"),
+    ]
+    assert messages[1].tool_calls == [{"name": "search", "args": {"q": "python"}}]
+    assert messages[1].meta == {"task_id": "t1", "root_id": "root", "result_type": "str"}
+
+    sessions = await db_manager.get_agent_sessions("session")
+    assert [(s.agent_name, s.user_query, s.agent_response, s.success) for s in sessions] == [
+        ("writer", "do the thing", "done", True),
+    ]
+
+    conversation = await db_manager.get_conversation("session")
+    assert conversation.agent_name == "writer"
+    assert conversation.root_id == "root"
+
+
+async def test_add_messages_batch_reuses_the_conversation(db_manager):
+    await db_manager.add_messages_batch(
+        session_id="session", messages=[{"role": "agent", "content": "first"}]
+    )
+    await db_manager.add_messages_batch(
+        session_id="session", messages=[{"role": "agent", "content": "second"}]
+    )
+
+    messages = await db_manager.get_messages("session")
+    assert [message.content for message in messages] == ["first", "second"]
+    assert len({message.conversation_id for message in messages}) == 1
+    assert len(await db_manager.list_conversations()) == 1
+
+
+async def test_add_messages_batch_with_nothing_to_write(db_manager):
+    assert await db_manager.add_messages_batch(session_id="session", messages=[]) == []
+    assert await db_manager.get_conversation("session") is None
@@ -0,0 +1,35 @@
+from types import SimpleNamespace
+
+import pytest
+
+from tron_ai.executors.swarm.utilities.report_generator import ReportGenerator
+from tron_ai.models.agent import Agent
+from tron_ai.models.prompts import Prompt
+from tron_ai.modules.tasks.models import AgentAssignedTask
+
+
+def make_task(result) -> AgentAssignedTask:
+    task = AgentAssignedTask(
+        description="Write a post",
+        operations=["draft"],
+        agent=Agent(name="writer", description="Writes things", prompt=Prompt(text="You are a writer.")),
+    )
+    task.result = result
+    return task
+
+
+@pytest.mark.parametrize(
+    ("result", "expected"),
+    [
+        (SimpleNamespace(generated_output="the post", response="done"), "the post"),
+        (SimpleNamespace(generated_output=None, response="done"), "done"),
+        ("plain text", "plain text"),
+        (None, ""),
+    ],
+)
+def test_task_summaries_prefer_generated_output(result, expected):
+    generator = ReportGenerator(client=SimpleNamespace(model="gpt-4o"), max_result_tokens=0)
+
+    (summary,) = generator._create_task_summaries([make_task(result)])
+
+    assert summary["result"] == expected
@@ -0,0 +1,224 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from adalflow.core.func_tool import FunctionTool
+from adalflow.core.tool_manager import ToolManager
+
+from tron_ai.executors.swarm.utilities import task_executor as task_executor_module
+from tron_ai.exceptions import TaskError
+from tron_ai.executors.swarm.utilities.task_executor import TaskExecutor
+from tron_ai.models.agent import Agent
+from tron_ai.models.prompts import Prompt
+from tron_ai.modules.tasks.models import AgentAssignedTask, DependencyResult
+
+
+class FakeClient:
+    model = "gpt-4o"
+
+    def __init__(self):
+        self.queries = []
+
+    async def afcall(self, user_query, system_prompt=None, tool_manager=None):
+        self.queries.append(user_query)
+        return SimpleNamespace(response=f"answer {len(self.queries)}")
+
+
+class FakeDatabaseManager:
+    def __init__(self):
+        self.batches = []
+
+    async def add_messages_batch(self, **row):
+        self.batches.append(row)
+
+
+def search(query: str) -> str:
+    """Search the web."""
+    return query
+
+
+def publish(post: str) -> str:
+    """Publish a post."""
+    return post
+
+
+def make_agent(tools=()) -> Agent:
+    return Agent(
+        name="writer",
+        description="Writes things",
+        prompt=Prompt(text="You are a writer."),
+        tool_manager=ToolManager(tools=[FunctionTool(tool) for tool in tools]) if tools else None,
+    )
+
+
+def make_task(description: str = "Write a post", agent: Agent = None) -> AgentAssignedTask:
+    return AgentAssignedTask(
+        description=description,
+        operations=["draft", "edit"],
+        agent=agent or make_agent(),
+    )
+
+
+@pytest.fixture
+def client():
+    return FakeClient()
+
+
+@pytest.fixture
+def db_manager(monkeypatch):
+    manager = FakeDatabaseManager()
+
+    async def get_db_manager():
+        return manager
+
+    monkeypatch.setattr(task_executor_module, "get_db_manager", get_db_manager)
+    return manager
+
+
+async def test_results_are_not_cached_by_default(client):
+    executor = TaskExecutor(client=client)
+
+    await executor.execute_tasks([make_task()], "query")
+    await executor.execute_tasks([make_task()], "query")
+
+    assert len(client.queries) == 2
+
+
+async def test_cached_result_is_reused_when_enabled(client):
+    executor = TaskExecutor(client=client, max_cached_results=8)
+
+    first = await executor.execute_tasks([make_task()], "query")
+    second = await executor.execute_tasks([make_task()], "query")
+
+    assert len(client.queries) == 1
+    assert second[-1].result is first[0].result
+
+
+async def test_cache_evicts_least_recently_used(client):
+    executor = TaskExecutor(client=client, max_cached_results=1)
+
+    await executor.execute_tasks([make_task("Write a post")], "query")
+    await executor.execute_tasks([make_task("Edit a post")], "query")
+    await executor.execute_tasks([make_task("Write a post")], "query")
+
+    assert len(client.queries) == 3
+
+
+async def test_cache_key_includes_agent_tools(client):
+    executor = TaskExecutor(client=client, max_cached_results=8)
+
+    await executor.execute_tasks([make_task(agent=make_agent([search]))], "query")
+    await executor.execute_tasks([make_task(agent=make_agent([publish]))], "query")
+    await executor.execute_tasks([make_task(agent=make_agent([search]))], "query")
+
+    assert len(client.queries) == 2
+
+
+async def test_cache_hits_are_logged_as_cached(client, db_manager):
+    executor = TaskExecutor(client=client, max_cached_results=8)
+
+    await executor.execute_tasks([make_task()], "query", session_id="session")
+    await executor.execute_tasks([make_task()], "query", session_id="session")
+
+    first, second = db_manager.batches
+    assert all("cached" not in message["meta"] for message in first["messages"])
+    assert all(message["meta"]["cached"] for message in second["messages"])
+    assert second["agent_sessions"][0]["meta"]["cached"] is True
+
+
+async def test_overlapping_runs_only_execute_their_own_tasks():
+    client = FakeClient()
+    release = asyncio.Event()
+    original_afcall = client.afcall
+
+    async def slow_afcall(user_query, system_prompt=None, tool_manager=None):
+        result = await original_afcall(user_query, system_prompt, tool_manager)
+        if "first query" in user_query:
+            await release.wait()
+        return result
+
+    client.afcall = slow_afcall
+    executor = TaskExecutor(client=client)
+
+    async def second_run():
+        # Start while the first run's task is still in flight
+        while not client.queries:
+            await asyncio.sleep(0)
+        try:
+            return await executor.execute_tasks([make_task("Edit a post")], "second query")
+        finally:
+            release.set()
+
+    first_task = make_task("Write a post")
+    first, second = await asyncio.gather(
+        executor.execute_tasks([first_task], "first query"),
+        second_run(),
+    )
+
+    assert first == [first_task]
+    assert [task.description for task in second] == ["Edit a post"]
+    assert len(client.queries) == 2
+    assert sum("first query" in query for query in client.queries) == 1
+    assert sum("second query" in query for query in client.queries) == 1
+
+
+async def test_runs_return_only_their_own_tasks_in_plan_order(client):
+    executor = TaskExecutor(client=client)
+
+    first = await executor.execute_tasks([make_task("Write a post")], "query")
+    tasks = [make_task("Edit a post"), make_task("Publish a post")]
+    second = await executor.execute_tasks(tasks, "query")
+
+    assert [task.identifier for task in first] != [task.identifier for task in second]
+    assert second == tasks
+
+
+async def test_earlier_failure_does_not_fail_later_runs(client):
+    executor = TaskExecutor(client=client)
+    failed = make_task("Research a topic")
+    failed.done = True
+    failed.error = "boom"
+    executor.task_manager.add_task(failed)
+    dependent = make_task("Write a post")
+    dependent.dependencies = [failed.identifier]
+
+    with pytest.raises(TaskError):
+        await executor.execute_tasks([dependent], "query")
+
+    task = make_task("Edit a post")
+    assert await executor.execute_tasks([task], "query") == [task]
+
+
+def test_operations_query_accepts_a_dependency_without_response(client):
+    executor = TaskExecutor(client=client)
+
+    query = executor._build_operations_query(
+        make_task(),
+        "query",
+        {
+            "empty": DependencyResult("Research", SimpleNamespace(response=None)),
+            "filled": DependencyResult("Outline", SimpleNamespace(response="an outline")),
+        },
+    )
+
+    assert "Dependency Task 'empty'" in query
+    assert "an outline" in query
+
+
+def test_executor_can_be_reused_across_event_loops(client):
+    original_afcall = client.afcall
+
+    async def yielding_afcall(user_query, system_prompt=None, tool_manager=None):
+        await asyncio.sleep(0)
+        return await original_afcall(user_query, system_prompt, tool_manager)
+
+    client.afcall = yielding_afcall
+    executor = TaskExecutor(client=client, max_concurrent_llm_calls=1)
+
+    async def run(description):
+        # Two tasks contend for the single slot, so the semaphore really waits
+        return await executor.execute_tasks([make_task(description), make_task(f"{description} again")], "query")
+
+    assert len(asyncio.run(run("Write a post"))) == 2
+    assert len(asyncio.run(run("Edit a post"))) == 2
+    assert len(client.queries) == 4
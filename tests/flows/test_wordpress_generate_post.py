@@ -0,0 +1,220 @@
+import json
+import os
+from types import SimpleNamespace
+
+import aiohttp
+import numpy as np
+import pytest
+
+from tron_ai.flows import wordpress_generate_post as wordpress
+from tron_ai.flows.wordpress_generate_post import (
+    PostState,
+    WordpressGeneratePost,
+    WordpressGeneratePostTools,
+)
+
+
+def make_photo(photo_id: int, alt: str) -> dict:
+    return {
+        "id": photo_id,
+        "photographer": "Ada",
+        "photographer_url": "https://pexels.com/@ada",
+        "alt": alt,
+        "width": 1920,
+        "src": {
+            "original": f"https://images.pexels.com/{photo_id}.jpg",
+            "large": f"https://images.pexels.com/{photo_id}-large.jpg",
+            "tiny": f"https://images.pexels.com/{photo_id}-tiny.jpg",
+        },
+    }
+
+
+PHOTOS = [make_photo(1, "a cat on a sofa"), make_photo(2, "python code on a laptop")]
+
+COMPLETIONS = {
+    "concept": SimpleNamespace(response="A concept"),
+    "title": SimpleNamespace(response="Python Tips"),
+    "content": SimpleNamespace(response="Post body"),
+    "metadata": SimpleNamespace(
+        meta_description=" A description ", keywords=["python", " "], tags=["Programming"]
+    ),
+    "article_bundle": SimpleNamespace(
+        title="Python Tips",
+        content="Fused body",
+        meta_description="A description",
+        keywords=["python"],
+        tags=["Programming"],
+    ),
+}
+
+
+async def fake_embed_texts(texts, model_name=None):
+    """Embeds texts by the animals and languages they mention."""
+    return np.array([[text.lower().count("python"), text.lower().count("cat"), 0.1] for text in texts])
+
+
+class FakeProviders:
+    """Stands in for the LLM executors and the Perplexity and Pexels APIs."""
+
+    def __init__(self):
+        self.completions = []
+        self.requests = []
+        self.failures = {}
+
+    async def run_completion(self, executor, query):
+        self.completions.append(executor)
+        return COMPLETIONS[executor]
+
+    async def request_body(self, provider, method, url, **kwargs):
+        self.requests.append(provider)
+        if provider in self.failures:
+            raise self.failures[provider]
+        if provider == "perplexity":
+            return json.dumps({"choices": [{"message": {"content": "Research notes"}}]}).encode()
+        return json.dumps({"photos": PHOTOS}).encode()
+
+
+@pytest.fixture
+def providers(monkeypatch, tmp_path):
+    fake = FakeProviders()
+    monkeypatch.setattr(wordpress, "run_completion", fake.run_completion)
+    monkeypatch.setattr(wordpress, "request_body", fake.request_body)
+    monkeypatch.setattr(wordpress, "embed_texts", fake_embed_texts)
+    for name in COMPLETIONS:
+        monkeypatch.setattr(wordpress, f"get_{name}_executor", lambda name=name: name)
+    monkeypatch.setattr(wordpress, "get_llm_client", lambda: SimpleNamespace(model="gpt-4o"))
+    monkeypatch.setattr(wordpress, "get_content_llm_client", lambda: SimpleNamespace(model="gpt-5"))
+    monkeypatch.setattr(wordpress, "POST_CACHE_DIR", str(tmp_path / "posts"))
+    monkeypatch.setattr(wordpress, "PEXELS_CACHE_DIR", str(tmp_path / "pexels"))
+    monkeypatch.setenv("PERPLEXITY_API_KEY", "perplexity-key")
+    monkeypatch.setenv("PEXELS_API_KEY", "pexels-key-0000")
+    return fake
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(wordpress.time, "time", lambda: now[0])
+    return now
+
+
+async def run_flow(flow: WordpressGeneratePost, query: str = "python tips"):
+    steps = []
+    result = None
+    async for update in flow.execute_stream(query):
+        steps.append(update["step"])
+        if update["step"] == "result":
+            result = update["result"]
+    # Let the background cache writes land before the next run reads them
+    await wordpress.flush_pending_writes()
+    return steps, result
+
+
+async def test_unfused_flow_runs_nodes_in_order(providers):
+    steps, result = await run_flow(WordpressGeneratePost())
+
+    assert steps == [
+        "generate_concept",
+        "generate_research_and_title",
+        "generate_content_and_metadata",
+        "finalize_content",
+        "result",
+    ]
+    assert sorted(providers.completions) == ["concept", "content", "metadata", "title"]
+    assert result["title"] == "Python Tips"
+    assert result["meta_description"] == "A description"
+    assert result["keywords"] == ["python"]
+    assert result["content"].startswith("![python code on a laptop](https://images.pexels.com/2-large.jpg)")
+    assert result["content"].endswith("\n\nPost body")
+
+
+async def test_fused_flow_generates_the_article_in_one_call(providers):
+    steps, result = await run_flow(WordpressGeneratePost(fuse_article_calls=True))
+
+    assert steps == [
+        "generate_concept",
+        "generate_research",
+        "generate_article_bundle",
+        "generate_banner_image",
+        "finalize_content",
+        "result",
+    ]
+    assert providers.completions == ["concept", "article_bundle"]
+    assert result["title"] == "Python Tips"
+    assert result["content"].endswith("\n\nFused body")
+
+
+async def test_cached_post_is_returned_without_running_the_graph(providers, clock):
+    _, first = await run_flow(WordpressGeneratePost())
+    calls = len(providers.completions)
+
+    steps, second = await run_flow(WordpressGeneratePost())
+
+    assert steps == ["result"]
+    assert second == first
+    assert len(providers.completions) == calls
+
+
+async def test_post_cache_misses_on_other_queries_and_settings(providers, clock):
+    await run_flow(WordpressGeneratePost())
+
+    steps, _ = await run_flow(WordpressGeneratePost(), "rust tips")
+    assert steps[0] == "generate_concept"
+    steps, _ = await run_flow(WordpressGeneratePost(fuse_article_calls=True))
+    assert steps[0] == "generate_concept"
+
+
+async def test_cached_post_expires(providers, clock):
+    await run_flow(WordpressGeneratePost())
+
+    clock[0] += wordpress.POST_CACHE_TTL + 1
+    steps, _ = await run_flow(WordpressGeneratePost())
+
+    assert steps[0] == "generate_concept"
+
+
+@pytest.mark.parametrize(
+    ("provider", "error"),
+    [
+        ("perplexity", aiohttp.ClientConnectionError("research down")),
+        ("pexels", aiohttp.ClientConnectionError("images down")),
+    ],
+)
+async def test_degraded_posts_are_not_cached(providers, clock, provider, error):
+    providers.failures[provider] = error
+    _, result = await run_flow(WordpressGeneratePost())
+    assert result["content"]
+
+    del providers.failures[provider]
+    steps, _ = await run_flow(WordpressGeneratePost())
+
+    assert steps[0] == "generate_concept"
+
+
+async def test_pexels_candidates_are_cached_and_ranked_per_post(providers, clock):
+    python_post = PostState(title="Python Tips", keywords=["laptop"])
+    await WordpressGeneratePostTools.generate_banner_image(python_post)
+    await wordpress.flush_pending_writes()
+    # Same search keywords, so the cached candidates are reused but ranked for this title
+    cat_post = PostState(title="Cat Care", keywords=["laptop"])
+    await WordpressGeneratePostTools.generate_banner_image(cat_post)
+
+    assert providers.requests == ["pexels"]
+    assert python_post.banner_image["id"] == 2
+    assert cat_post.banner_image["id"] == 1
+    assert "markdown" in cat_post.banner_image
+
+    (cache_file,) = os.listdir(wordpress.PEXELS_CACHE_DIR)
+    with open(os.path.join(wordpress.PEXELS_CACHE_DIR, cache_file)) as f:
+        cached = json.load(f)
+    assert cached["result"]["photos"] == [wordpress.compact_photo(photo) for photo in PHOTOS]
+
+
+async def test_expired_pexels_candidates_are_fetched_again(providers, clock):
+    await WordpressGeneratePostTools.generate_banner_image(PostState(title="Python Tips", keywords=["laptop"]))
+    await wordpress.flush_pending_writes()
+
+    clock[0] += wordpress.PEXELS_CACHE_TTL + 1
+    await WordpressGeneratePostTools.generate_banner_image(PostState(title="Python Tips", keywords=["laptop"]))
+
+    assert providers.requests == ["pexels", "pexels"]
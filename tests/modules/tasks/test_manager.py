@@ -0,0 +1,217 @@
+import asyncio
+
+import pytest
+
+from tron_ai.modules.tasks import Manager, Task
+
+
+def make_task(identifier: str, *dependencies: str, priority: int = 0) -> Task:
+    return Task(
+        identifier=identifier,
+        description=f"Task {identifier}",
+        dependencies=list(dependencies),
+        priority=priority,
+    )
+
+
+def make_manager(*tasks: Task) -> Manager:
+    manager = Manager()
+    for task in tasks:
+        manager.add_task(task)
+    return manager
+
+
+async def test_execute_all_runs_dependencies_first():
+    manager = make_manager(
+        make_task("a"),
+        make_task("b", "a"),
+        make_task("c", "a"),
+        make_task("d", "b", "c"),
+    )
+    finished = []
+
+    async def handler(task, dependency_results):
+        assert set(dependency_results) == set(task.dependencies)
+        assert all(dep in finished for dep in task.dependencies)
+        await asyncio.sleep(0)
+        task.result = task.identifier
+        finished.append(task.identifier)
+
+    await manager.execute_all(handler)
+
+    assert finished[0] == "a"
+    assert finished[-1] == "d"
+    assert all(task.done and not task.error for task in manager.tasks)
+
+
+async def test_execute_all_passes_dependency_results():
+    manager = make_manager(make_task("a"), make_task("b", "a"))
+    received = {}
+
+    async def handler(task, dependency_results):
+        received[task.identifier] = dependency_results
+        task.result = f"result of {task.identifier}"
+
+    await manager.execute_all(handler)
+
+    assert received["a"] == {}
+    assert received["b"]["a"].description == "Task a"
+    assert received["b"]["a"].result == "result of a"
+
+
+async def test_execute_all_starts_a_task_as_soon_as_its_dependencies_finish():
+    # "fast" must not wait for the unrelated "slow" task to finish first
+    manager = make_manager(make_task("slow"), make_task("quick"), make_task("fast", "quick"))
+    slow_released = asyncio.Event()
+    order = []
+
+    async def handler(task, dependency_results):
+        if task.identifier == "slow":
+            await slow_released.wait()
+        order.append(task.identifier)
+        if task.identifier == "fast":
+            slow_released.set()
+
+    await manager.execute_all(handler)
+
+    assert order == ["quick", "fast", "slow"]
+
+
+async def test_execute_all_respects_concurrency_and_priority():
+    manager = make_manager(
+        make_task("low", priority=0),
+        make_task("high", priority=10),
+        make_task("mid", priority=5),
+    )
+    started = []
+    in_flight = 0
+    peak = 0
+
+    async def handler(task, dependency_results):
+        nonlocal in_flight, peak
+        started.append(task.identifier)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    await manager.execute_all(handler, concurrency=1)
+
+    assert peak == 1
+    assert started == ["high", "mid", "low"]
+
+
+async def test_failed_task_propagates_to_dependents_only():
+    manager = make_manager(
+        make_task("bad"),
+        make_task("child", "bad"),
+        make_task("grandchild", "child"),
+        make_task("independent"),
+    )
+    handled = []
+
+    async def handler(task, dependency_results):
+        handled.append(task.identifier)
+        if task.identifier == "bad":
+            raise RuntimeError("boom")
+
+    await manager.execute_all(handler)
+
+    # Dependents fail their dependency check without reaching the handler
+    assert sorted(handled) == ["bad", "independent"]
+    failed = {task.identifier: task.error for task in manager.tasks if task.error}
+    assert set(failed) == {"bad", "child", "grandchild"}
+    assert failed["bad"] == "boom"
+    assert "bad" in failed["child"]
+    assert manager.get_task("independent").error is None
+    assert manager.is_all_complete()
+
+
+async def test_execute_all_detects_cycles():
+    manager = make_manager(make_task("a", "c"), make_task("b", "a"), make_task("c", "b"))
+
+    async def handler(task, dependency_results):
+        pytest.fail("no task should run when the graph has a cycle")
+
+    with pytest.raises(ValueError, match="Circular dependency"):
+        await manager.execute_all(handler)
+
+
+async def test_execute_all_rejects_missing_dependencies():
+    manager = make_manager(make_task("a", "missing"))
+
+    async def handler(task, dependency_results):
+        pytest.fail("no task should run when a dependency is missing")
+
+    with pytest.raises(ValueError, match="Missing dependency: missing"):
+        await manager.execute_all(handler)
+
+
+async def test_execute_all_skips_tasks_that_are_already_done():
+    done = make_task("done")
+    done.result = "cached"
+    done.done = True
+    manager = make_manager(done, make_task("next", "done"))
+    handled = []
+
+    async def handler(task, dependency_results):
+        handled.append(task.identifier)
+        assert dependency_results["done"].result == "cached"
+
+    await manager.execute_all(handler)
+
+    assert handled == ["next"]
+
+
+def test_add_task_rejects_duplicate_ids():
+    manager = make_manager(make_task("a"))
+
+    with pytest.raises(ValueError, match="Duplicate task ID"):
+        manager.add_task(make_task("a"))
+
+
+async def test_execute_all_runs_only_the_given_tasks():
+    manager = make_manager(make_task("earlier"))
+
+    async def handler(task, dependency_results):
+        task.result = f"result of {task.identifier}"
+
+    await manager.execute_all(handler, task_ids=["earlier"])
+    # A task from another run is registered but must not be scheduled here
+    manager.add_task(make_task("other"))
+    manager.add_task(make_task("current", "earlier"))
+    handled = []
+
+    async def record(task, dependency_results):
+        handled.append(task.identifier)
+        assert dependency_results["earlier"].result == "result of earlier"
+
+    await manager.execute_all(record, task_ids=["current"])
+
+    assert handled == ["current"]
+    assert not manager.get_task("other").done
+
+
+async def test_concurrent_runs_do_not_share_tasks():
+    manager = Manager()
+    first_started = asyncio.Event()
+    handled = []
+
+    async def handler(task, dependency_results):
+        handled.append(task.identifier)
+        if task.identifier == "first":
+            first_started.set()
+            await asyncio.sleep(0.01)
+
+    async def run(*tasks):
+        for task in tasks:
+            manager.add_task(task)
+        await manager.execute_all(handler, task_ids=[task.identifier for task in tasks])
+
+    async def second_run():
+        await first_started.wait()
+        await run(make_task("second"))
+
+    await asyncio.gather(run(make_task("first")), second_run())
+
+    assert sorted(handled) == ["first", "second"]
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from tron_ai.models.prompts import Prompt
+from tron_ai.utils.llm import semantic_cache
+from tron_ai.utils.llm.semantic_cache import SemanticCache
+
+
+async def fake_embed_texts(texts, model_name=None):
+    """Embeds texts as normalized letter counts, so similar wording scores close to 1."""
+    vectors = np.zeros((len(texts), 26))
+    for row, text in enumerate(texts):
+        for char in text.lower():
+            if "a" <= char <= "z":
+                vectors[row, ord(char) - ord("a")] += 1
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+@pytest.fixture(autouse=True)
+def embeddings(monkeypatch):
+    monkeypatch.setattr(semantic_cache, "embed_texts", fake_embed_texts)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(semantic_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+async def test_returns_response_for_the_same_query():
+    cache = SemanticCache()
+    await cache.put("ns", "write a post about python", "response")
+
+    assert await cache.get("ns", "write a post about python") == "response"
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+async def test_matches_near_duplicate_queries():
+    cache = SemanticCache(threshold=0.9)
+    await cache.put("ns", "write a post about python", "response")
+
+    assert await cache.get("ns", "Write a post about Python!") == "response"
+
+
+async def test_misses_dissimilar_queries():
+    cache = SemanticCache(threshold=0.9)
+    await cache.put("ns", "write a post about python", "response")
+
+    assert await cache.get("ns", "zzz qqq jjj") is None
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+async def test_namespaces_do_not_share_entries():
+    cache = SemanticCache()
+    await cache.put("one", "query", "response")
+
+    assert await cache.get("two", "query") is None
+
+
+async def test_returns_the_closest_entry():
+    cache = SemanticCache(threshold=0.5)
+    await cache.put("ns", "apples and pears", "fruit")
+    await cache.put("ns", "python programming", "code")
+
+    assert await cache.get("ns", "python programs") == "code"
+
+
+async def test_entries_expire_after_ttl(clock):
+    cache = SemanticCache(ttl=10)
+    await cache.put("ns", "query", "response")
+
+    clock[0] += 9
+    assert await cache.get("ns", "query") == "response"
+    clock[0] += 2
+    assert await cache.get("ns", "query") is None
+
+
+async def test_evicts_the_oldest_entry_past_max_entries():
+    cache = SemanticCache(max_entries=2)
+    await cache.put("ns", "aaaa", "first")
+    await cache.put("ns", "bbbb", "second")
+    await cache.put("ns", "cccc", "third")
+
+    assert await cache.get("ns", "aaaa") is None
+    assert await cache.get("ns", "bbbb") == "second"
+    assert await cache.get("ns", "cccc") == "third"
+
+
+async def test_is_a_no_op_without_an_embedding_model(monkeypatch):
+    async def unavailable(texts, model_name=None):
+        return None
+
+    monkeypatch.setattr(semantic_cache, "embed_texts", unavailable)
+    cache = SemanticCache()
+    await cache.put("ns", "query", "response")
+
+    assert await cache.get("ns", "query") is None
+
+
+def test_namespace_depends_on_model_and_prompt():
+    prompt = Prompt(text="You are a writer.")
+    other_prompt = Prompt(text="You are an editor.")
+
+    namespace = SemanticCache.namespace("gpt-4o", prompt)
+
+    assert namespace == SemanticCache.namespace("gpt-4o", Prompt(text="You are a writer."))
+    assert namespace != SemanticCache.namespace("gpt-4o-mini", prompt)
+    assert namespace != SemanticCache.namespace("gpt-4o", other_prompt)
@@ -0,0 +1,85 @@
+import pytest
+
+from tron_ai.utils.llm import tokens
+from tron_ai.utils.llm.tokens import truncate_tokens
+
+
+class WordEncoding:
+    """A tokenizer stand-in with one token per space-separated word."""
+
+    def encode(self, text, **kwargs):
+        return text.split(" ")
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+@pytest.fixture
+def word_encoding(monkeypatch):
+    monkeypatch.setattr(tokens, "_get_encoding", lambda model_name: WordEncoding())
+
+
+@pytest.fixture
+def no_encoding(monkeypatch):
+    monkeypatch.setattr(tokens, "_get_encoding", lambda model_name: None)
+
+
+def words(count: int) -> str:
+    return " ".join(f"w{i}" for i in range(count))
+
+
+@pytest.mark.parametrize("max_tokens", [0, -1])
+def test_non_positive_budget_disables_truncation(word_encoding, max_tokens):
+    text = words(50)
+    assert truncate_tokens(text, max_tokens) == text
+
+
+def test_text_within_budget_is_unchanged(word_encoding):
+    text = words(10)
+    assert truncate_tokens(text, 10) is text
+
+
+def test_short_text_skips_the_tokenizer(monkeypatch):
+    def fail(model_name):
+        raise AssertionError("short text should not be tokenized")
+
+    monkeypatch.setattr(tokens, "_get_encoding", fail)
+    assert truncate_tokens("short", 100) == "short"
+
+
+def test_keeps_head_and_tail_within_budget(word_encoding):
+    text = words(100)
+
+    result = truncate_tokens(text, 10, head_ratio=0.6)
+
+    head, marker, tail = result.split("\n")
+    assert head == words(6)
+    assert tail == " ".join(f"w{i}" for i in range(96, 100))
+    assert marker == "...[truncated 90 tokens]..."
+
+
+@pytest.mark.parametrize("head_ratio", [0.0, 0.25, 1.0])
+def test_kept_tokens_never_exceed_budget(word_encoding, head_ratio):
+    text = words(100)
+
+    result = truncate_tokens(text, 8, head_ratio=head_ratio)
+
+    head, _, tail = result.split("\n")
+    kept = [token for token in f"{head} {tail}".split(" ") if token]
+    assert len(kept) == 8
+
+
+def test_approximates_by_characters_without_a_tokenizer(no_encoding):
+    text = "x" * 1000
+
+    result = truncate_tokens(text, 50, head_ratio=0.5)
+
+    head, marker, tail = result.split("\n")
+    assert head == "x" * 100
+    assert tail == "x" * 100
+    assert marker == "...[truncated 200 tokens]..."
+
+
+def test_approximation_leaves_text_within_character_budget(no_encoding):
+    text = "x" * 200
+    assert truncate_tokens(text, 50) == text
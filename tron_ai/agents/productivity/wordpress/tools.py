@@ -2,7 +2,7 @@
 from typing import List, Dict, Any, Optional
 from tron_ai.agents.productivity.wordpress.utils import get_wordpress_client
 from tron_ai.flows.wordpress_generate_post import WordpressGeneratePost
-import json
+from tron_ai.utils.io import json as json_utils
 import logging
 from datetime import datetime
 
@@ -87,12 +87,19 @@ class WordPressTools:
         
         # Execute the flow asynchronously
         import asyncio
-        result = asyncio.run(flow.execute(query=user_post_idea))
+
+        async def _run():
+            try:
+                return await flow.execute(query=user_post_idea)
+            finally:
+                await flow.aclose()
+
+        result = asyncio.run(_run())
         
         return {
             "success": True,
             "message": "Blog post made successfully",
-            "result": json.dumps(result)
+            "result": json_utils.dumps(result)
         }
     
         # except Exception as e:
@@ -113,3 +113,7 @@ async def ask(user_query: Optional[str], agent: str) -> None:
             
     except Exception as e:
         raise AskCommandError(f"Failed to process query: {e}") from e
+    finally:
+        # Swarm runs log through the shared per-loop manager
+        from tron_ai.database.manager import close_db_manager
+        await close_db_manager()
@@ -61,13 +61,13 @@ class ChatSession:
         setup_cli_logging()
         
         # Lazy imports to avoid initialization issues
-        from tron_ai.database.config import DatabaseConfig
+        from tron_ai.database.config import get_db_config
         from tron_ai.database.manager import DatabaseManager
         from tron_ai.models.config import BaseGroqConfig
         from tron_ai.utils.llm.LLMClient import get_llm_client_from_config
         
         # Initialize database
-        db_config = DatabaseConfig()
+        db_config = get_db_config()
         self.db_manager = DatabaseManager(db_config)
         await self.db_manager.initialize()
         
@@ -435,6 +435,9 @@ class ChatSession:
         finally:
             if self.db_manager:
                 await self.db_manager.close()
+            # Swarm runs log through the shared per-loop manager
+            from tron_ai.database.manager import close_db_manager
+            await close_db_manager()
 
 
 @click.command(name='chat', help='Start an interactive chat session with an AI agent.')
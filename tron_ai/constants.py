@@ -34,6 +34,9 @@ MEMORY_DAYS_MONTH = 30
 # Agent Executor Constants
 AGENT_MIN_REQUIRED = 1
 
+# Swarm Constants
+SWARM_CONTEXT_BATCH_SIZE = 8  # Tasks enriched per repository-context LLM call
+
 # File Operation Constants
 FILE_READ_CHUNK_SIZE = 1024 * 1024  # 1MB
 FILE_MAX_SIZE = 100 * 1024 * 1024  # 100MB
@@ -46,4 +46,16 @@ class DatabaseConfig(BaseModel):
         self.database_path.mkdir(parents=True, exist_ok=True)
         # Update database_url if using default path
         if self.database_url.startswith("sqlite+aiosqlite:///./data/"):
-            self.database_url = f"sqlite+aiosqlite:///{self.database_path}/conversations.db" 
\ No newline at end of file
+            self.database_url = f"sqlite+aiosqlite:///{self.database_path}/conversations.db" 
+
+
+# Global config instance
+_db_config: Optional[DatabaseConfig] = None
+
+
+def get_db_config() -> DatabaseConfig:
+    """Get the default database configuration, building it on first use."""
+    global _db_config
+    if _db_config is None:
+        _db_config = DatabaseConfig()
+    return _db_config
@@ -1,6 +1,8 @@
 """Database manager for conversation history operations."""
 
+import asyncio
 import logging
+import weakref
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List, Dict, Any
 from contextlib import asynccontextmanager
@@ -9,7 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 from sqlalchemy import select, delete, desc
 from sqlalchemy.exc import IntegrityError
 
-from .config import DatabaseConfig
+from .config import DatabaseConfig, get_db_config
 from .models import Base, Conversation, Message, AgentSession
 from .models import A2AContext, A2ATask, A2AAgentInteraction
 from .models import ConversationResponse, MessageResponse, AgentSessionResponse
@@ -114,32 +116,36 @@ class DatabaseManager:
             return ConversationResponse.model_validate(conversation)
 
     # Message Management
+    async def _get_or_create_conversation(self, session: AsyncSession, session_id: str, agent_name: Optional[str] = None, meta: Optional[Dict[str, Any]] = None, root_id: Optional[str] = None) -> Conversation:
+        stmt = select(Conversation).where(Conversation.session_id == session_id)
+        result = await session.execute(stmt)
+        conversation = result.scalar_one_or_none()
+        if not conversation:
+            # Try to create conversation, handle race condition
+            # If root_id is not provided, try to get from meta/context
+            root_id_to_use = root_id or (meta.get('root_id') if meta and 'root_id' in meta else session_id)
+            conversation = Conversation(
+                session_id=session_id,
+                agent_name=agent_name or "swarm",
+                title=f"Swarm session {session_id}",
+                meta={"auto_created": True},
+                root_id=root_id_to_use,
+            )
+            session.add(conversation)
+            try:
+                await session.flush()
+            except IntegrityError:
+                await session.rollback()
+                # Fetch the conversation that was just created by another process
+                result = await session.execute(stmt)
+                conversation = result.scalar_one_or_none()
+                if not conversation:
+                    raise  # Unexpected: should exist now
+        return conversation
+
     async def add_message(self, session_id: str, role: str, content: str, agent_name: Optional[str] = None, tool_calls: Optional[List[Dict[str, Any]]] = None, meta: Optional[Dict[str, Any]] = None, task_id: Optional[str] = None, root_id: Optional[str] = None) -> Optional[MessageResponse]:
         async with self.get_session() as session:
-            stmt = select(Conversation).where(Conversation.session_id == session_id)
-            result = await session.execute(stmt)
-            conversation = result.scalar_one_or_none()
-            if not conversation:
-                # Try to create conversation, handle race condition
-                # If root_id is not provided, try to get from meta/context
-                root_id_to_use = root_id or (meta.get('root_id') if meta and 'root_id' in meta else session_id)
-                conversation = Conversation(
-                    session_id=session_id,
-                    agent_name=agent_name or "swarm",
-                    title=f"Swarm session {session_id}",
-                    meta={"auto_created": True},
-                    root_id=root_id_to_use,
-                )
-                session.add(conversation)
-                try:
-                    await session.flush()
-                except IntegrityError:
-                    await session.rollback()
-                    # Fetch the conversation that was just created by another process
-                    result = await session.execute(stmt)
-                    conversation = result.scalar_one_or_none()
-                    if not conversation:
-                        raise  # Unexpected: should exist now
+            conversation = await self._get_or_create_conversation(session, session_id, agent_name, meta, root_id)
             message = Message(
                 conversation_id=conversation.id,
                 task_id=task_id,
@@ -154,6 +160,42 @@ class DatabaseManager:
             await session.flush()
             return MessageResponse.model_validate(message)
 
+    async def add_messages_batch(self, session_id: str, messages: List[Dict[str, Any]], agent_sessions: Optional[List[Dict[str, Any]]] = None, root_id: Optional[str] = None) -> List[MessageResponse]:
+        """Add messages and agent sessions for one conversation in a single transaction.
+
+        Each entry in `messages` takes the keyword arguments of `add_message` and
+        each entry in `agent_sessions` those of `add_agent_session`, both without
+        `session_id`. Everything is written with one conversation lookup and one
+        commit instead of a round-trip per row.
+        """
+        agent_sessions = agent_sessions or []
+        if not messages and not agent_sessions:
+            return []
+        async with self.get_session() as session:
+            first = messages[0] if messages else agent_sessions[0]
+            conversation = await self._get_or_create_conversation(session, session_id, first.get("agent_name"), first.get("meta"), root_id)
+            message_rows = [
+                Message(
+                    conversation_id=conversation.id,
+                    task_id=message.get("task_id"),
+                    role=message["role"],
+                    content=message["content"],
+                    agent_name=message.get("agent_name"),
+                    tool_calls=message.get("tool_calls"),
+                    meta=message.get("meta"),
+                )
+                for message in messages
+            ]
+            session.add_all(message_rows)
+            session.add_all(
+                AgentSession(conversation_id=conversation.id, **agent_session)
+                for agent_session in agent_sessions
+            )
+            if message_rows:
+                conversation.updated_at = datetime.now(timezone.utc)
+            await session.flush()
+            return [MessageResponse.model_validate(message) for message in message_rows]
+
     async def get_messages(self, session_id: str, limit: int = 100, offset: int = 0) -> List[MessageResponse]:
         async with self.get_session() as session:
             stmt = (
@@ -458,4 +500,38 @@ class DatabaseManager:
             cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
             stmt = delete(A2AContext).where(A2AContext.updated_at < cutoff_date)
             result = await session.execute(stmt)
-            return result.rowcount 
\ No newline at end of file
+            return result.rowcount
+
+
+# One manager per event loop. The engine's pooled aiosqlite connections and the
+# initialization lock belong to the loop that created them, and nested
+# asyncio.run calls (e.g. tools run in worker threads) each start a new loop.
+_db_managers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, DatabaseManager]" = weakref.WeakKeyDictionary()
+_db_manager_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
+async def get_db_manager() -> DatabaseManager:
+    """Get the running event loop's database manager, initializing it on first use.
+
+    The manager owns the engine's connection pool, so reusing it spares each
+    workflow the cost of building an engine, creating tables and opening fresh
+    connections. Close it before the loop shuts down with `close_db_manager`.
+    """
+    loop = asyncio.get_running_loop()
+    lock = _db_manager_locks.get(loop)
+    if lock is None:
+        lock = _db_manager_locks.setdefault(loop, asyncio.Lock())
+    async with lock:
+        manager = _db_managers.get(loop)
+        if manager is None:
+            manager = DatabaseManager(get_db_config())
+            await manager.initialize()
+            _db_managers[loop] = manager
+    return manager
+
+
+async def close_db_manager() -> None:
+    """Dispose of the running event loop's database manager, if one was created."""
+    manager = _db_managers.pop(asyncio.get_running_loop(), None)
+    if manager is not None:
+        await manager.close()
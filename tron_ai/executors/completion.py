@@ -3,19 +3,35 @@ import pydantic
 from typing import Optional
 
 from tron_ai.executors.base import Executor
+from tron_ai.utils.llm.semantic_cache import SemanticCache, get_semantic_cache
 from adalflow.core.tool_manager import ToolManager
 
 
 class CompletionExecutor(Executor):
+    _cache_namespace: Optional[str] = None
+
     async def execute(
         self,
         user_query: str,
         tool_manager: Optional[ToolManager] = None,
         prompt_kwargs: dict = {},
     ) -> pydantic.BaseModel:
-        return self.client.fcall(
+        # Tool calls and prompt kwargs make a response depend on more than the query
+        use_cache = self._config.semantic_cache and tool_manager is None and not prompt_kwargs
+        if use_cache:
+            cache = get_semantic_cache()
+            if self._cache_namespace is None:
+                self._cache_namespace = SemanticCache.namespace(self.client.model, self.prompt)
+            cached = await cache.get(self._cache_namespace, user_query)
+            if cached is not None:
+                return cached
+
+        response = await self.client.afcall(
             user_query=user_query,
             system_prompt=self._config.prompt,
             tool_manager=tool_manager,
             prompt_kwargs=prompt_kwargs
         )
+        if use_cache:
+            await cache.put(self._cache_namespace, user_query, response)
+        return response
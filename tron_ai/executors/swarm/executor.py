@@ -87,6 +87,9 @@ class SwarmExecutor(Executor):
         self.timeout: float = timeout
         self.max_cycles: int = max_cycles
         self.tools: SwarmTools = SwarmTools(client=self.client)
+        # The graph topology is static and run() keeps no per-run state on it,
+        # so it is built once and reused for every query.
+        self._graph: StateGraph = build_swarm_graph(self.tools)
 
     async def execute(self, user_query: str) -> SwarmState:
         """Execute the delegation workflow for the given user query.
@@ -102,15 +105,11 @@ class SwarmExecutor(Executor):
         """
         self.logger.info(f"Starting execution for query: {user_query}")
         # try:
-        graph = build_swarm_graph(self.tools)
-        state = self.state.model_copy(update={
-            "user_query": user_query,
-            "agents": self.state.agents
-        })
-        for name, func in graph.nodes.items():
-            async def wrapper(s, func=func, name=name):
-                return await func(s)
-            graph.nodes[name] = wrapper
+        graph = self._graph
+        # Shallow copy: agents (and their tool managers) are shared by reference,
+        # and the graph nodes only ever reassign list fields, never mutate them.
+        state = self.state.model_copy()
+        state.user_query = user_query
         result = await graph.run(initial_state=state, timeout=self.timeout, max_cycles=self.max_cycles)
         return result
         # except ExecutionError as e:
@@ -2,7 +2,7 @@ from pydantic import BaseModel, Field
 from tron_ai.modules.tasks import Task
 from tron_ai.models.agent import Agent
 from typing import List, Optional
-from tron_ai.models.prompts import PromptMeta, ToolCall
+from tron_ai.models.prompts import BasePromptResponse, PromptMeta, ToolCall
 import logging
 import uuid
 
@@ -36,44 +36,46 @@ class SwarmState(BaseModel):
     response: Optional[str] = Field(default=None, description="Direct response when no tasks are generated")
     
     def task_report(self) -> str:
-        logger.info(f"Generating task report for {len(self.tasks)} tasks")
-        markdown = "# Task Execution Plan\n\n"
-        for i, task in enumerate(self.tasks):
-            logger.debug(f"Processing task {i+1}: {task.identifier}")
-            markdown += f"## Task {i + 1}: {task.description}\n\n"
-            markdown += f"- **ID**: `{task.identifier}`\n"
-            markdown += f"- **Priority**: {task.priority}\n"
+        logger.info("Generating task report for %d tasks", len(self.tasks))
+        parts = ["# Task Execution Plan\n\n"]
+        append = parts.append
+        for i, task in enumerate(self.tasks, 1):
+            logger.debug("Processing task %d: %s", i, task.identifier)
+            append(f"## Task {i}: {task.description}\n\n")
+            append(f"- **ID**: `{task.identifier}`\n")
+            append(f"- **Priority**: {task.priority}\n")
             if task.dependencies:
-                markdown += (
-                    "- **Dependencies**: "
-                    + ", ".join([f"`{dep}`" for dep in task.dependencies])
-                    + "\n"
-                )
+                append("- **Dependencies**: ")
+                append(", ".join(f"`{dep}`" for dep in task.dependencies))
+                append("\n")
             else:
-                markdown += "- **Dependencies**: None\n"
-            markdown += "\n### Operations:\n\n"
-            for j, operation in enumerate(task.operations):
-                markdown += f"{j + 1}. {operation}\n"
-            markdown += "\n"
-            if task.result:
-                markdown += "## Results\n\n"
+                append("- **Dependencies**: None\n")
+            append("\n### Operations:\n\n")
+            for j, operation in enumerate(task.operations, 1):
+                append(f"{j}. {operation}\n")
+            append("\n")
+            result = task.result
+            if result:
+                append("## Results\n\n")
                 # First try to get generated_output if available (for MarketerResponse and similar)
-                if hasattr(task.result, 'generated_output') and task.result.generated_output:
-                    result_length = len(task.result.generated_output)
-                    logger.info(f"Task {i+1} has generated_output with {result_length} characters")
-                    logger.debug(f"Task {i+1} generated_output preview: {task.result.generated_output[:200]}...")
-                    markdown += task.result.generated_output + "\n"
-                elif hasattr(task.result, 'response') and task.result.response:
-                    result_length = len(task.result.response)
-                    logger.info(f"Task {i+1} has result with {result_length} characters")
-                    logger.debug(f"Task {i+1} result preview: {task.result.response[:200]}...")
-                    markdown += task.result.response + "\n"
+                generated_output = getattr(result, 'generated_output', None)
+                response = getattr(result, 'response', None)
+                if generated_output:
+                    logger.info("Task %d has generated_output with %d characters", i, len(generated_output))
+                    logger.debug("Task %d generated_output preview: %.200s...", i, generated_output)
+                    append(generated_output)
+                    append("\n")
+                elif response:
+                    logger.info("Task %d has result with %d characters", i, len(response))
+                    logger.debug("Task %d result preview: %.200s...", i, response)
+                    append(response)
+                    append("\n")
                 else:
-                    logger.info(f"Task {i+1} has result of type: {type(task.result)}")
-                    markdown += f"```json\n{task.result}\n```\n"
-        
-        total_length = len(markdown)
-        logger.info(f"Generated task report with total length: {total_length} characters")
+                    logger.info("Task %d has result of type: %s", i, type(result))
+                    append(f"```json\n{result}\n```\n")
+
+        markdown = "".join(parts)
+        logger.info("Generated task report with total length: %d characters", len(markdown))
         return markdown
     
     
@@ -151,4 +153,39 @@ class SwarmResults(PromptMeta, BaseModel):
     tool_calls: Optional[List[ToolCall]] = Field(
         default_factory=list, 
         description="List of tools called during agent execution"
-    )
\ No newline at end of file
+    )
+
+class TaskContext(BaseModel):
+    """Repository context gathered for a single task.
+
+    Attributes:
+        identifier (str): The identifier of the task the context belongs to.
+        context (str): A summary of the code structures relevant to the task.
+    """
+
+    identifier: str = Field(description="The identifier of the task this context belongs to")
+    context: str = Field(
+        default="",
+        description="Summary of the repository structures, dependencies and key elements relevant to the task"
+    )
+
+
+class BatchContextResults(BasePromptResponse):
+    """Repository context for a batch of tasks gathered in a single call.
+
+    Attributes:
+        items (List[TaskContext]): One entry per task, keyed by the task identifier.
+    """
+
+    items: List[TaskContext] = Field(
+        default_factory=list,
+        description="Context entries, one per task, each referencing the task identifier it belongs to"
+    )
+
+    @staticmethod
+    def example() -> dict:
+        return {
+            "items": [
+                {"identifier": "task_id", "context": "Relevant code context for the task."}
+            ]
+        }
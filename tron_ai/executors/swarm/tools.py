@@ -1,16 +1,20 @@
 # Standard library imports
+import asyncio
 from datetime import datetime
 import logging
+from operator import attrgetter
 from dataclasses import dataclass
+from functools import cached_property
 
 # Third-party imports
+from tron_ai.constants import SWARM_CONTEXT_BATCH_SIZE
 from tron_ai.exceptions import ExecutionError
 from tron_ai.modules.tasks import Task
 from tron_ai.models.prompts import Prompt
 from tron_ai.utils.llm.LLMClient import LLMClient
 
 # Local imports
-from .models import SwarmState, SwarmResults
+from .models import SwarmState, SwarmResults, BatchContextResults
 from tron_ai.executors.swarm.utilities.agent_selector import AgentSelector
 from tron_ai.executors.swarm.utilities.report_generator import ReportGenerator
 from tron_ai.executors.swarm.utilities.task_executor import TaskExecutor
@@ -102,6 +106,17 @@ class SwarmTools:
         self.agent_selector = AgentSelector(self.client)
         self.task_executor = TaskExecutor(self.client)
         self.report_generator = ReportGenerator(self.client)
+
+    @cached_property
+    def _code_scanner(self):
+        """The code scanner agent used for context enrichment, built on first use.
+
+        The import stays lazy because the scanner pulls in tree-sitter and graph
+        backends that plain swarm runs never need.
+        """
+        from tron_ai.agents.devops.code_scanner.agent import CodeScannerAgent
+
+        return CodeScannerAgent()
         
     async def generate_tasks(self, state: SwarmState) -> SwarmState:
         """Generates a list of tasks by interpreting the user's query.
@@ -121,7 +136,7 @@ class SwarmTools:
         Raises:
             ExecutionError: If the LLM call fails or returns an unexpected response.
         """
-        self.logger.debug(f"Entering generate_tasks for user query: {state.user_query}")
+        self.logger.debug("Entering generate_tasks for user query: %s", state.user_query)
         self.logger.info(f"Processing user query: {state.user_query}")
         try:
             task_manager_prompt = Prompt(
@@ -130,22 +145,22 @@ class SwarmTools:
             )
             self.logger.debug("Built task manager prompt.")
 
-            agents_info = [
-                (agent.name, agent.description, agent.supports_multiple_operations)
-                for agent in state.agents
-            ]
-            self.logger.debug(f"Calling LLM with agents: {agents_info}")
+            agents_info = list(
+                map(attrgetter("name", "description", "supports_multiple_operations"), state.agents)
+            )
+            self.logger.debug("Calling LLM with agents: %s", agents_info)
 
             response = self.client.call(
                 user_query=str({"user_query": state.user_query}),
                 system_prompt=task_manager_prompt,
                 prompt_kwargs={"agents": agents_info},
             )
-            self.logger.debug(f"LLM response received: {response}")
+            self.logger.debug("LLM response received: %s", response)
             if response.tasks:
                 self.logger.info(f"Generated {len(response.tasks)} tasks")
-                for i, task in enumerate(response.tasks):
-                    self.logger.debug(f"Task {i+1}: {task.description}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    for i, task in enumerate(response.tasks):
+                        self.logger.debug("Task %d: %s", i + 1, task.description)
                 # Update state with generated tasks
                 state.tasks = response.tasks
             else:
@@ -153,7 +168,7 @@ class SwarmTools:
                 # Store the direct response if provided
                 if response.response:
                     state.response = response.response
-                    self.logger.debug(f"Stored direct response: {response.response}")
+                    self.logger.debug("Stored direct response: %s", response.response)
 
             self.logger.debug("Exiting generate_tasks.")
             return state
@@ -201,12 +216,14 @@ class SwarmTools:
             ExecutionError: If any tasks cannot be assigned to an agent.
         """
         self.logger.debug("Entering assign_agents.")
-        self.logger.debug(f"Assigning agents for {len(state.tasks)} tasks.")
+        self.logger.debug("Assigning agents for %d tasks.", len(state.tasks))
         selected_tasks, unassigned_tasks = self.agent_selector.select_agents(
             state.user_query, state.tasks, state.agents
         )
         self.logger.debug(
-            f"Agent selection complete. {len(selected_tasks)} tasks assigned, {len(unassigned_tasks)} unassigned."
+            "Agent selection complete. %d tasks assigned, %d unassigned.",
+            len(selected_tasks),
+            len(unassigned_tasks),
         )
         if not selected_tasks and not unassigned_tasks:
             self.logger.error("Error during execution: No tasks were assigned to agents")
@@ -240,12 +257,12 @@ class SwarmTools:
             ExecutionError: If a critical error occurs during task execution.
         """
         self.logger.info("Executing tasks...")
-        self.logger.debug(f"Executing {len(state.tasks)} tasks.")
+        self.logger.debug("Executing %d tasks.", len(state.tasks))
         try:
             completed_tasks = await self.task_executor.execute_tasks(
                 state.tasks, state.user_query, session_id=state.session_id, root_id=state.root_id
             )
-            self.logger.debug(f"Completed {len(completed_tasks)} tasks.")
+            self.logger.debug("Completed %d tasks.", len(completed_tasks))
             state.tasks = completed_tasks
             self.logger.debug("Exiting execute_tasks.")
             return state
@@ -274,49 +291,76 @@ class SwarmTools:
             return state
 
         self.logger.info("Task execution completed")
-        self.logger.debug(f"Handling results for {len(state.tasks)} completed tasks.")
-        # Log the full results object
-        self.logger.debug(f"Full state.tasks: {state.tasks}")
-        for i, task in enumerate(state.tasks):
-            self.logger.debug(f"Task {i+1} result: {getattr(task.result, 'response', task.result)}")
+        self.logger.debug("Handling results for %d completed tasks.", len(state.tasks))
+        # Log the full results object; repr-ing every task result is expensive,
+        # so only do it when debug output is actually emitted.
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Full state.tasks: %s", state.tasks)
+            for i, task in enumerate(state.tasks):
+                self.logger.debug("Task %d result: %s", i + 1, getattr(task.result, 'response', task.result))
         state.results = state.tasks
-        task_descriptions = [task.description for task in state.tasks]
-        state.report = (
-            f"Completed {len(state.tasks)} tasks: {', '.join(task_descriptions)}"
+        state.report = f"Completed {len(state.tasks)} tasks: " + ", ".join(
+            map(attrgetter("description"), state.tasks)
         )
-        self.logger.debug(f"Generated report: {state.report}")
+        self.logger.debug("Generated report: %s", state.report)
         self.logger.debug("Exiting handle_results.")
         
 
         return state
 
     async def enrich_tasks_with_context(self, state: SwarmState) -> SwarmState:
-        """Enriches tasks with repository graph context if repo_path is provided."""
+        """Enriches tasks with repository graph context if repo_path is provided.
+
+        Tasks are sent to the code scanner in batches of
+        `SWARM_CONTEXT_BATCH_SIZE`, each batch resolved by a single structured
+        call that returns context keyed by task identifier. Batches run
+        concurrently.
+        """
         if not state.repo_path:
             self.logger.debug("No repo_path provided, skipping context enrichment.")
             return state
         
-        from tron_ai.agents.devops.code_scanner.agent import CodeScannerAgent
-        
-        agent = CodeScannerAgent()
-        self.logger.debug(f"Enriching {len(state.tasks)} tasks with context from repo: {state.repo_path}")
-        
-        for task in state.tasks:
+        agent = self._code_scanner
+        self.logger.debug("Enriching %d tasks with context from repo: %s", len(state.tasks), state.repo_path)
+
+        context_prompt = Prompt(text=agent.prompt.text, output_format=BatchContextResults)
+        tasks_by_id = {task.identifier: task for task in state.tasks}
+
+        async def enrich_batch(batch: list[Task]) -> None:
+            task_list = "\n".join(
+                f"- ID: {task.identifier}, Description: {task.description}" for task in batch
+            )
             context_query = (
                 f"Provide relevant code context from the repository at {state.repo_path} "
-                f"for this task: {task.description}. "
-                f"Use tools to query the graph and summarize key structures, dependencies, and high PageRank elements."
+                f"for each of the following tasks:\n{task_list}\n\n"
+                f"Use tools to query the graph and summarize key structures, dependencies, and high PageRank elements. "
+                f"Return one item per task, using the task ID as the identifier."
             )
             try:
-                result = self.client.fcall(
+                result = await self.client.afcall(
                     user_query=context_query,
-                    system_prompt=agent.prompt,
+                    system_prompt=context_prompt,
                     tool_manager=agent.tool_manager,
                 )
-                task.context = result.response
-                self.logger.debug(f"Added context to task {task.identifier}")
             except Exception as e:
-                self.logger.warning(f"Failed to enrich task {task.identifier}: {str(e)}")
+                self.logger.warning(
+                    "Failed to enrich tasks %s: %s", [task.identifier for task in batch], e
+                )
+                return
+            for item in result.items:
+                task = tasks_by_id.get(item.identifier)
+                if task is None:
+                    self.logger.debug("Ignoring context for unknown task %s", item.identifier)
+                    continue
+                task.context = item.context
+                self.logger.debug("Added context to task %s", task.identifier)
+
+        await asyncio.gather(
+            *(
+                enrich_batch(state.tasks[i:i + SWARM_CONTEXT_BATCH_SIZE])
+                for i in range(0, len(state.tasks), SWARM_CONTEXT_BATCH_SIZE)
+            )
+        )
         
         return state
 
@@ -336,7 +380,7 @@ class SwarmTools:
         Returns:
             The modified state with tasks and results cleared.
         """
-        self.logger.debug(f"Entering create_error with message: {error_message}")
+        self.logger.debug("Entering create_error with message: %s", error_message)
         state.results = []
         state.tasks = []
         self.logger.debug("State has been reset due to an error.")
@@ -26,6 +26,33 @@ class AgentSelector:
             client: An instance of LLMClient to interact with the language model.
         """
         self.client = client
+        # Rendered agent rosters keyed by their (name, description) pairs. The
+        # roster is stable for a swarm run, so the string is built once and the
+        # exact same bytes are sent on every routing call.
+        self._agent_info_cache: dict[tuple, str] = {}
+
+    @staticmethod
+    def _agent_key(agents: Sequence[Agent]) -> tuple:
+        """Builds a hashable key identifying an agent roster."""
+        return tuple((agent.name, agent.description) for agent in agents)
+
+    def _get_agent_info(self, agents: Sequence[Agent]) -> str:
+        """Returns the formatted agent roster, building it on first use.
+
+        Args:
+            agents: The agents to describe.
+
+        Returns:
+            One "Name: ..., Description: ..." line per agent.
+        """
+        key = self._agent_key(agents)
+        agent_info = self._agent_info_cache.get(key)
+        if agent_info is None:
+            agent_info = "\n".join(
+                f"Name: {name}, Description: {description}" for name, description in key
+            )
+            self._agent_info_cache[key] = agent_info
+        return agent_info
 
     def select_agent(self, user_query: str, agents: Sequence[Agent]) -> Optional[Agent]:
         """Selects the single most appropriate agent for a given user query.
@@ -44,7 +71,7 @@ class AgentSelector:
             text="You are a helpful assistant that selects the most appropriate agent for a given user query.",
             output_format=AgentRouterResults
         )
-        agent_info = [(agent.name, agent.description) for agent in agents]
+        agent_info = self._agent_key(agents)
 
         response = self.client.call(
             user_query=user_query,
@@ -75,7 +102,7 @@ class AgentSelector:
             - A list of `Task` objects that could not be assigned to any agent.
         """
         
-        logging.info(f"Selecting agents for {len(tasks)} tasks")
+        logger.info("Selecting agents for %d tasks", len(tasks))
         
         router_prompt = Prompt(
             text='''
@@ -92,7 +119,7 @@ class AgentSelector:
             ''',
             output_format=AgentRouterResults
         )
-        agent_info = "\n".join([f"Name: {agent.name}, Description: {agent.description}" for agent in agents])
+        agent_info = self._get_agent_info(agents)
         task_info = "\n".join([f"ID: {task.identifier}, Description: {task.description}" for task in tasks])
         
         response = self.client.call(
@@ -102,20 +129,20 @@ class AgentSelector:
         )
         
         selected_agents = response.selected_agents
-        logging.info(f"LLM selected {len(selected_agents)} agent-task pairs")
+        logger.info("LLM selected %d agent-task pairs", len(selected_agents))
 
         unassigned_tasks = []
         assigned_tasks = []
         for agent_id, task_id in selected_agents:
-            logging.info(f"Processing agent-task pair: {agent_id} - {task_id}")
+            logger.info("Processing agent-task pair: %s - %s", agent_id, task_id)
             for task in tasks:
                 if task.identifier == task_id[1]:
                     matching_agent = next(
                         (agent for agent in agents if agent.name == agent_id[1]), None
                     )
                     if matching_agent:
-                        logging.info(
-                            f"Assigned task '{task.identifier}' to agent '{matching_agent.name}'"
+                        logger.info(
+                            "Assigned task '%s' to agent '%s'", task.identifier, matching_agent.name
                         )
                         agent_assigned_task = AgentAssignedTask(
                             identifier=task.identifier,
@@ -125,12 +152,14 @@ class AgentSelector:
                         )
                         assigned_tasks.append(agent_assigned_task)
                     else:
-                        logging.info(
-                            f"Could not find matching agent '{agent_id[1]}' for task '{task.identifier}'"
+                        logger.info(
+                            "Could not find matching agent '%s' for task '%s'", agent_id[1], task.identifier
                         )
                         unassigned_tasks.append(task)
 
-        logging.info(
-            f"Assignment complete: {len(assigned_tasks)} tasks assigned, {len(unassigned_tasks)} tasks unassigned"
+        logger.info(
+            "Assignment complete: %d tasks assigned, %d tasks unassigned",
+            len(assigned_tasks),
+            len(unassigned_tasks),
         )
         return assigned_tasks, unassigned_tasks
@@ -1,7 +1,44 @@
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+from collections import OrderedDict
+import asyncio
+import hashlib
 from tron_ai.modules.tasks.models import AgentAssignedTask
-from tron_ai.models.prompts import Prompt
+from tron_ai.models.prompts import Prompt, PromptDefaultResponse
 from tron_ai.utils.llm.LLMClient import LLMClient
+from tron_ai.utils.llm.tokens import truncate_tokens
+
+
+_REPORT_SYSTEM_PROMPT = """You are an expert at analyzing task execution results. 
+Your role is to:
+1. Understand the user's original intent from their query
+2. Analyze how well the executed tasks fulfilled that intent
+3. Provide insights about the task execution process
+4. Evaluate the completeness and quality of the results
+5. Suggest any potential improvements or additional steps if needed
+
+Then a concise summary of the report.
+
+Provide a detailed, insightful analysis that helps users understand both what was accomplished and how it relates to their original request."""
+
+
+# Static instructions lead so only the query and results vary per call
+_REPORT_ANALYSIS_TEMPLATE = """Analyze the following task execution results in the context of the original user request.
+
+Please provide a detailed analysis focusing on:
+1. How well the tasks fulfilled the user's original request
+2. How tasks worked together and dependencies were handled
+3. Key findings or results from each task
+4. Overall success of the workflow
+5. Any notable patterns or insights
+6. Whether the results fully address the user's needs
+
+Provide your analysis in a clear, structured format that connects the results back to the original query.
+
+Original User Query:
+"{user_query}"
+
+Task Results:
+{task_info}"""
 
 
 class ReportGenerator:
@@ -11,15 +48,36 @@ class ReportGenerator:
     into a human-readable report. It combines a high-level execution summary
     with a detailed, LLM-generated analysis that connects the task outcomes
     back to the original user query.
+
+    `generate_report` blocks on the analysis call. Async callers with several
+    independent workflows should use `agenerate_report` so the reports run
+    concurrently, e.g.
+    `await asyncio.gather(*(generator.agenerate_report(tasks, query) for tasks, query in batch))`,
+    or `generate_reports(batch)`.
     """
 
-    def __init__(self, client: LLMClient):
+    def __init__(
+        self,
+        client: LLMClient,
+        max_cached_reports: int = 64,
+        max_result_tokens: int = 2000,
+    ):
         """Initializes the ReportGenerator.
 
         Args:
             client: An instance of LLMClient used to generate the detailed analysis.
+            max_cached_reports: The maximum number of analyses memoized by exact
+                prompt. Set to 0 to disable caching.
+            max_result_tokens: The token budget for each task result included in
+                the analysis prompt. Set to 0 to include results in full.
         """
         self.client = client
+        # LRU cache of analyses keyed by a digest of the system and user prompts
+        self._report_cache: OrderedDict[str, PromptDefaultResponse] = OrderedDict()
+        self._max_cached_reports = max_cached_reports
+        self.max_result_tokens = max_result_tokens
+        # Built once so every report sends an identical system prompt
+        self._report_prompt = Prompt(text=_REPORT_SYSTEM_PROMPT)
 
     def generate_report(self, tasks: List[AgentAssignedTask], user_query: str) -> str:
         """Generates a detailed analysis report of the completed tasks.
@@ -46,18 +104,88 @@ class ReportGenerator:
         summary = self._create_execution_summary(tasks)
 
         # Combine summary and detailed report
-        if hasattr(detailed_report, "response"):
-            return (
-                "\n".join(summary)
-                + "\n\n=== Detailed Analysis ===\n\n"
-                + detailed_report.response
+        return self._combine_report(summary, detailed_report)
+
+    async def agenerate_report(
+        self, tasks: List[AgentAssignedTask], user_query: str
+    ) -> str:
+        """Async variant of `generate_report`.
+
+        The analysis call is started first and the execution summary is built
+        while it is in flight, so summary assembly is hidden behind the LLM
+        round-trip.
+
+        Args:
+            tasks: A list of completed `AgentAssignedTask` objects, including their results.
+            user_query: The original user query that initiated the workflow.
+
+        Returns:
+            A formatted string containing the full report.
+        """
+        task_info = self._format_task_info(self._create_task_summaries(tasks))
+        prompt = self._build_analysis_prompt(task_info, user_query)
+        cache_key = self._analysis_cache_key(prompt)
+        detailed_report = self._get_cached_analysis(cache_key)
+
+        analysis = None
+        if detailed_report is None:
+            analysis = asyncio.create_task(
+                self.client.acall(user_query=prompt, system_prompt=self._report_prompt)
             )
-        else:
-            return (
-                "\n".join(summary)
-                + "\n\n=== Detailed Analysis ===\n\n"
-                + detailed_report
+        summary = self._create_execution_summary(tasks)
+        if analysis is not None:
+            detailed_report = await analysis
+            self._cache_analysis(cache_key, detailed_report)
+
+        return self._combine_report(summary, detailed_report)
+
+    async def generate_reports(
+        self, batch: List[Tuple[List[AgentAssignedTask], str]]
+    ) -> List[str]:
+        """Generates reports for several independent workflows at once.
+
+        Cached analyses are reused and the remaining analysis prompts are sent
+        together through `LLMClient.abatch_call`, so the LLM round-trips overlap
+        instead of running back to back.
+
+        Args:
+            batch: Pairs of (tasks, user_query), one per report.
+
+        Returns:
+            The formatted reports, in the same order as `batch`.
+        """
+        prompts = [
+            self._build_analysis_prompt(
+                self._format_task_info(self._create_task_summaries(tasks)), user_query
             )
+            for tasks, user_query in batch
+        ]
+        keys = [self._analysis_cache_key(prompt) for prompt in prompts]
+        analyses = [self._get_cached_analysis(key) for key in keys]
+
+        misses = [i for i, analysis in enumerate(analyses) if analysis is None]
+        if misses:
+            responses = await self.client.abatch_call(
+                [prompts[i] for i in misses], system_prompt=self._report_prompt
+            )
+            for i, response in zip(misses, responses):
+                analyses[i] = response
+                self._cache_analysis(keys[i], response)
+
+        return [
+            self._combine_report(self._create_execution_summary(tasks), analysis)
+            for (tasks, _), analysis in zip(batch, analyses)
+        ]
+
+    def _combine_report(
+        self, summary: List[str], detailed_report: PromptDefaultResponse
+    ) -> str:
+        """Joins the execution summary with the LLM analysis."""
+        return (
+            "\n".join(summary)
+            + "\n\n=== Detailed Analysis ===\n\n"
+            + (detailed_report.response or "")
+        )
 
     def _create_task_summaries(self, tasks: List[AgentAssignedTask]) -> List[Dict]:
         """Creates a list of structured dictionaries, one for each task.
@@ -77,11 +205,29 @@ class ReportGenerator:
                 "description": task.description,
                 "agent": task.agent.name,
                 "dependencies": task.dependencies,
-                "result": str(task.result),
+                "result": truncate_tokens(
+                    self._result_text(task.result),
+                    self.max_result_tokens,
+                    self.client.model,
+                ),
             }
             for task in tasks
         ]
 
+    @staticmethod
+    def _result_text(result) -> str:
+        """Returns the text of a task result, using the same precedence as
+        `SwarmState.task_report`: `generated_output` (MarketerResponse and
+        similar), then `response`, then the result itself.
+        """
+        if not result:
+            return ""
+        return (
+            getattr(result, "generated_output", None)
+            or getattr(result, "response", None)
+            or str(result)
+        )
+
     def _format_task_info(self, task_summaries: List[Dict]) -> str:
         """Formats the task summaries into a single string for the LLM prompt.
 
@@ -92,17 +238,15 @@ class ReportGenerator:
             A formatted string detailing the results of all tasks.
         """
         return "\n".join(
-            [
-                f"Task {t['id']}:"
-                f"\nDescription: {t['description']}"
-                f"\nAgent: {t['agent']}"
-                f"\nDependencies: {', '.join(t['dependencies']) if t['dependencies'] else 'None'}"
-                f"\nResult: {t['result']}\n"
-                for t in task_summaries
-            ]
+            f"Task {t['id']}:"
+            f"\nDescription: {t['description']}"
+            f"\nAgent: {t['agent']}"
+            f"\nDependencies: {', '.join(t['dependencies']) if t['dependencies'] else 'None'}"
+            f"\nResult: {t['result']}\n"
+            for t in task_summaries
         )
 
-    def _generate_detailed_report(self, task_info: str, user_query: str) -> str:
+    def _generate_detailed_report(self, task_info: str, user_query: str) -> PromptDefaultResponse:
         """Uses the LLM to generate an in-depth analysis of the task results.
 
         This method constructs a detailed prompt asking the LLM to analyze the
@@ -114,45 +258,51 @@ class ReportGenerator:
             user_query: The original user query.
 
         Returns:
-            The LLM-generated analysis as a string.
+            The LLM-generated analysis. The report prompt uses the default output
+            format, so the text is always on `.response`.
         """
-        prompt = f"""Analyze the following task execution results in the context of the original user request.
-
-Original User Query:
-"{user_query}"
-
-Task Results:
-{task_info}
-
-Please provide a detailed analysis focusing on:
-1. How well the tasks fulfilled the user's original request
-2. How tasks worked together and dependencies were handled
-3. Key findings or results from each task
-4. Overall success of the workflow
-5. Any notable patterns or insights
-6. Whether the results fully address the user's needs
-
-Provide your analysis in a clear, structured format that connects the results back to the original query."""
+        prompt = self._build_analysis_prompt(task_info, user_query)
+        cache_key = self._analysis_cache_key(prompt)
+        response = self._get_cached_analysis(cache_key)
+        if response is not None:
+            return response
 
         response = self.client.call(
             user_query=prompt,
-            system_prompt=Prompt(
-                text="""You are an expert at analyzing task execution results. 
-Your role is to:
-1. Understand the user's original intent from their query
-2. Analyze how well the executed tasks fulfilled that intent
-3. Provide insights about the task execution process
-4. Evaluate the completeness and quality of the results
-5. Suggest any potential improvements or additional steps if needed
+            system_prompt=self._report_prompt,
+        )
 
-Then a concise summary of the report.
+        self._cache_analysis(cache_key, response)
+        return response
 
-Provide a detailed, insightful analysis that helps users understand both what was accomplished and how it relates to their original request."""
-            ),
+    def _build_analysis_prompt(self, task_info: str, user_query: str) -> str:
+        """Builds the user prompt for the analysis call."""
+        return _REPORT_ANALYSIS_TEMPLATE.format_map(
+            {"user_query": user_query, "task_info": task_info}
         )
 
+    def _analysis_cache_key(self, prompt: str) -> str:
+        """Returns the cache key for an analysis of `prompt`."""
+        return hashlib.sha256(
+            f"{self._report_prompt.text}\0{prompt}".encode("utf-8")
+        ).hexdigest()
+
+    def _get_cached_analysis(self, key: str) -> Optional[PromptDefaultResponse]:
+        """Returns a memoized analysis and marks it as recently used."""
+        response = self._report_cache.get(key)
+        if response is not None:
+            self._report_cache.move_to_end(key)
         return response
 
+    def _cache_analysis(self, key: str, response: PromptDefaultResponse) -> None:
+        """Memoizes an analysis, evicting the least recently used entries."""
+        if self._max_cached_reports <= 0 or response is None:
+            return
+        self._report_cache[key] = response
+        self._report_cache.move_to_end(key)
+        while len(self._report_cache) > self._max_cached_reports:
+            self._report_cache.popitem(last=False)
+
     def _create_execution_summary(self, tasks: List[AgentAssignedTask]) -> List[str]:
         """Creates a high-level summary of the task execution statistics.
 
@@ -166,29 +316,32 @@ Provide a detailed, insightful analysis that helps users understand both what wa
         Returns:
             A list of strings that form the execution summary.
         """
-        completed_tasks = [t for t in tasks if t.done and not t.error]
-        failed_tasks = [t for t in tasks if t.error]
+        # Partition in a single pass rather than one scan per bucket
+        completed_tasks = []
+        failed_count = 0
+        for t in tasks:
+            if t.error:
+                failed_count += 1
+            elif t.done:
+                completed_tasks.append(t)
 
         # Optimized: Build summary header with list, then extend with comprehension
         summary = [
             "=== Execution Summary ===\n",
             f"Total Tasks: {len(tasks)}\n",
             f"Completed: {len(completed_tasks)}\n",
-            f"Failed: {len(failed_tasks)}\n",
+            f"Failed: {failed_count}\n",
             "\nTask Results:\n",
         ]
 
-        # Optimized: Generate task summaries using list comprehension with conditional elements
-        task_summaries = []
+        # Write each task's lines straight into the summary
+        append = summary.append
         for task in completed_tasks:
-            task_summary = [
-                f"\n[{task.identifier}] {task.description}",
-                f"Agent: {task.agent.name}",
-            ]
+            append(f"\n[{task.identifier}] {task.description}")
+            append(f"Agent: {task.agent.name}")
             if task.dependencies:
-                task_summary.append(f"Dependencies: {', '.join(task.dependencies)}")
-            task_summary.extend(["Result:\n\n", f"{task.result.response}", "---"])
-            task_summaries.extend(task_summary)
-
-        summary.extend(task_summaries)
+                append(f"Dependencies: {', '.join(task.dependencies)}")
+            append("Result:\n\n")
+            append(f"{task.result.response}")
+            append("---")
         return summary
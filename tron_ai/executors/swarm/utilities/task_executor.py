@@ -1,19 +1,43 @@
-from typing import List
+from typing import Any, List, Optional
+from collections import OrderedDict
 import asyncio
+import hashlib
+import weakref
 from tron_ai.constants import TIMEOUT_TASK_EXECUTION
-from tron_ai.modules.tasks import Task, Manager
+from tron_ai.modules.tasks import Task, Manager, DependencyResult
 from tron_ai.utils.llm.LLMClient import LLMClient
+from tron_ai.utils.llm.tokens import truncate_tokens
 from tron_ai.exceptions import (
     TaskError,
     TimeoutError as TronTimeoutError,
     AgentError,
 )
-from tron_ai.database.manager import DatabaseManager
-from tron_ai.database.config import DatabaseConfig
+from tron_ai.database.manager import get_db_manager
 
 import logging
 import types
 
+# Result types produced by routing/orchestration whose tool calls are not logged
+_ROUTER_RESULT_TYPES = frozenset({"AgentRouterResults", "SwarmResults"})
+
+# Formatting instructions appended to every task query sent to an agent
+_RESPONSE_FORMAT_SUFFIX = (
+    "\n\nAlways return your response in markdown format.\n\n"
+    "IMPORTANT: When displaying email snippets or any content retrieved from APIs, ALWAYS show the COMPLETE text. "
+    "NEVER truncate, shorten, or add phrases like '[truncated for brevity]' or similar. Display all content in full."
+)
+
+# Static parts of the per-task agent query built by _build_operations_query
+_QUERY_HEADER_TEMPLATE = (
+    "Original Query: {user_query}\n"
+    "Task Description: {description}\n"
+    "\nOperations to perform in sequence:\n"
+)
+_DEPENDENCY_RESULTS_HEADER = "\nDependency Results:\n"
+_DEPENDENCY_SECTION_TEMPLATE = (
+    "Dependency Task '{dep_id}':\n- Description: {description}\n- Result:\n"
+)
+
 
 class TaskExecutor:
     """Handles the execution of a list of tasks with dependency management and parallelism.
@@ -29,6 +53,10 @@ class TaskExecutor:
         client: LLMClient,
         max_completed_tasks: int = 1000,
         result_size_limit_mb: int = 50,
+        max_concurrent_tasks: int = 8,
+        max_cached_results: int = 0,
+        max_dep_tokens: int = 2000,
+        max_concurrent_llm_calls: int = 8,
     ):
         """Initializes the TaskExecutor with resource management settings.
 
@@ -38,8 +66,32 @@ class TaskExecutor:
                 in memory, preventing unbounded growth.
             result_size_limit_mb: The total size limit in megabytes for all
                 stored task results to prevent excessive memory usage.
+            max_concurrent_tasks: The maximum number of tasks executing at once.
+                Bounds peak memory held by in-flight results regardless of how
+                wide the dependency graph is.
+            max_cached_results: The maximum number of agent results memoized by
+                (agent, prompt, tools, query). Disabled by default (0): a cache
+                hit replays the earlier result instead of running the agent's
+                tools again, so only enable it for agents whose tools are free
+                of side effects and not time-sensitive.
+            max_dep_tokens: The token budget for each dependency result inserted
+                into a task query; longer results keep their head and tail. Set
+                to 0 to insert results in full.
+            max_concurrent_llm_calls: The maximum number of agent LLM calls in
+                flight across every `execute_tasks` run sharing this executor.
+                Keeps request bursts under provider rate limits so retries and
+                backoff do not serialize progress.
         """
         self.client = client
+        self.max_concurrent_tasks = max_concurrent_tasks
+        # LRU cache of agent results keyed by a digest of (agent, prompt, tools, query)
+        self._result_cache: OrderedDict[str, Any] = OrderedDict()
+        self._max_cached_results = max_cached_results
+        self.max_dep_tokens = max_dep_tokens
+        self.max_concurrent_llm_calls = max_concurrent_llm_calls
+        # Semaphores are bound to the loop they first wait on, so each running
+        # loop (e.g. separate asyncio.run calls) gets its own
+        self._llm_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
         # Initialize TaskManager with memory limits
         self.task_manager = Manager(
             max_completed_tasks=max_completed_tasks,
@@ -67,21 +119,28 @@ class TaskExecutor:
             TaskError: If one or more tasks fail during execution.
         """
         db_manager = None
+        # Local to this run so overlapping execute_tasks calls each drain their own
+        log_queue: Optional[asyncio.Queue] = None
+        log_worker: Optional[asyncio.Task] = None
         if session_id:
-            db_config = DatabaseConfig()
-            db_manager = DatabaseManager(db_config)
-            await db_manager.initialize()
-
-        async def task_handler(task: Task, dependency_results: dict[str, str]):
+            db_manager = await get_db_manager()
+            # Conversation logging is not needed to return results, so writes
+            # are handed to a background worker. The queue is bounded so bursts
+            # apply backpressure instead of growing memory without limit.
+            log_queue = asyncio.Queue(maxsize=1000)
+            log_worker = asyncio.create_task(self._drain_log_queue(db_manager, log_queue))
+
+        async def task_handler(task: Task, dependency_results: dict[str, DependencyResult]):
             try:
                 if hasattr(task, "agent") and task.agent:
+                    task_id = task.identifier
+                    agent_name = task.agent.name
                     self.logger.info(
-                        f"Executing task '{task.identifier}' with agent '{task.agent.name}'"
+                        "Executing task '%s' with agent '%s' (%d dependencies)",
+                        task_id,
+                        agent_name,
+                        len(dependency_results),
                     )
-                    if dependency_results:
-                        self.logger.info(
-                            f"Task has {len(dependency_results)} dependencies"
-                        )
 
                     # Build operation-specific query
                     operations_query = self._build_operations_query(
@@ -93,122 +152,124 @@ class TaskExecutor:
                             TIMEOUT_TASK_EXECUTION  
                         ):  # Increased timeout for multiple operations
                             self.logger.info(
-                                f"Calling agent for task '{task.identifier}' with {len(task.operations)} operations"
+                                "Calling agent for task '%s' with %d operations",
+                                task_id,
+                                len(task.operations),
                             )
-                            self.logger.debug(f"Calling agent '{task.agent.name}' for task '{task.identifier}'")
 
-                            result = self.client.fcall(
-                                user_query=operations_query + "\n\n"+ "Always return your response in markdown format.\n\nIMPORTANT: When displaying email snippets or any content retrieved from APIs, ALWAYS show the COMPLETE text. NEVER truncate, shorten, or add phrases like '[truncated for brevity]' or similar. Display all content in full.",
-                                system_prompt=task.agent.prompt,
-                                tool_manager=task.agent.tool_manager,
-                            )
+                            agent_query = operations_query + _RESPONSE_FORMAT_SUFFIX
+                            cache_key = None
+                            result = None
+                            if self._max_cached_results > 0:
+                                cache_key = self._result_cache_key(task, agent_query)
+                                result = self._get_cached_result(cache_key)
+                            cache_hit = result is not None
+                            if cache_hit:
+                                self.logger.info("Reusing cached result for task '%s'", task_id)
+                            else:
+                                async with self._llm_semaphore():
+                                    result = await self.client.afcall(
+                                        user_query=agent_query,
+                                        system_prompt=task.agent.prompt,
+                                        tool_manager=task.agent.tool_manager,
+                                    )
+                                if cache_key is not None:
+                                    self._cache_result(cache_key, result)
 
                             task.result = result
                             
                             # Log the actual result content
                             if hasattr(result, 'response'):
-                                self.logger.info(f"Task '{task.identifier}' result length: {len(result.response)} characters")
-                                self.logger.debug(f"Task '{task.identifier}' full result: {result.response[:500]}..." if len(result.response) > 500 else f"Task '{task.identifier}' full result: {result.response}")
+                                self.logger.info("Task '%s' result length: %d characters", task_id, len(result.response))
+                                self.logger.debug(
+                                    "Task '%s' full result: %.500s%s",
+                                    task_id,
+                                    result.response,
+                                    "..." if len(result.response) > 500 else "",
+                                )
                             else:
-                                self.logger.info(f"Task '{task.identifier}' result type: {type(result)}")
-                                self.logger.debug(f"Task '{task.identifier}' result: {str(result)[:500]}...")
+                                self.logger.info("Task '%s' result type: %s", task_id, type(result))
+                                # %.500s defers str(result) until a handler emits
+                                self.logger.debug("Task '%s' result: %.500s...", task_id, result)
                             
-                            self.logger.info(
-                                f"Task '{task.identifier}' completed successfully"
-                            )
+                            self.logger.info("Task '%s' completed successfully", task_id)
                             # --- Database logging for agent-to-agent messages ---
                             if db_manager:
+                                response_text = getattr(result, 'response', None) or (str(result) if result is not None else "")
+                                result_type_name = type(result).__name__
                                 # Only log tool_calls if result is not a router/orchestrator result and not just the known error
                                 tool_calls_to_log = None
-                                # Check if the result actually has tool_calls before trying to access it
-                                try:
-                                    if hasattr(result, 'tool_calls') and result.tool_calls:
-                                        # Defensive: skip if result is a known router/orchestrator type or just the known error
-                                        router_types = (str,)
-                                        is_router_type = hasattr(result, '__class__') and result.__class__.__name__ in ["AgentRouterResults", "SwarmResults"]
-                                        # Check for the specific error pattern
-                                        is_only_router_error = (
-                                            len(result.tool_calls) == 1 and
-                                            result.tool_calls[0].get('name') == 'execute_on_swarm' and
-                                            'AgentRouterResults' in str(result.tool_calls[0].get('error', ''))
+                                tool_calls = getattr(result, 'tool_calls', None)
+                                if tool_calls and result_type_name not in _ROUTER_RESULT_TYPES:
+                                    # Check for the specific error pattern; the name test
+                                    # is cheap, so only stringify the error once it matches
+                                    is_only_router_error = False
+                                    if len(tool_calls) == 1 and tool_calls[0].get('name') == 'execute_on_swarm':
+                                        error = tool_calls[0].get('error', '')
+                                        is_only_router_error = 'AgentRouterResults' in (
+                                            error if isinstance(error, str) else str(error)
                                         )
-                                        if not is_router_type and not is_only_router_error:
-                                            tool_calls_to_log = result.tool_calls
-                                except AttributeError:
-                                    # If we get an AttributeError when accessing tool_calls, just skip it
-                                    self.logger.debug(f"Result type {type(result).__name__} does not have tool_calls field")
-                                    tool_calls_to_log = None
-                                await db_manager.add_message(
-                                    session_id=session_id,
-                                    role="agent",
-                                    content=operations_query,
-                                    agent_name=task.agent.name,
-                                    meta={
-                                        "task_id": task.identifier,
-                                        "task_description": task.description,
-                                        "operations": task.operations,
-                                        "dependencies": task.dependencies,
-                                        "root_id": root_id,
-                                    },
-                                    task_id=task.identifier,
-                                    root_id=root_id,
-                                )
-                                # Prepare content for assistant message
-                                content = getattr(result, 'response', None)
-                                if not content:
-                                    content = str(result) if result is not None else ""
+                                    if not is_only_router_error:
+                                        tool_calls_to_log = tool_calls
+                                # One meta dict shared by every row for this task. The
+                                # database layer only serializes it, so rows can
+                                # reference it (and the task's lists) without copies.
+                                base_meta = {
+                                    "task_id": task_id,
+                                    "task_description": task.description,
+                                    "operations": task.operations,
+                                    "dependencies": task.dependencies,
+                                    "root_id": root_id,
+                                }
+                                if cache_hit:
+                                    # The agent did not run; the rows replay a memoized result
+                                    base_meta["cached"] = True
+                                messages = [{
+                                    "role": "agent",
+                                    "content": operations_query,
+                                    "agent_name": agent_name,
+                                    "meta": base_meta,
+                                    "task_id": task_id,
+                                }]
                                 # Only log assistant message if content is not empty
-                                if content:
-                                    await db_manager.add_message(
-                                        session_id=session_id,
-                                        role="assistant",
-                                        content=content,
-                                        agent_name=task.agent.name,
-                                        tool_calls=tool_calls_to_log,
-                                        meta={
-                                            "task_id": task.identifier,
-                                            "task_description": task.description,
-                                            "operations": task.operations,
-                                            "dependencies": task.dependencies,
-                                            "result_type": str(type(result)),
-                                            "root_id": root_id,
-                                        },
-                                        task_id=task.identifier,
-                                        root_id=root_id,
-                                    )
-                                await db_manager.add_agent_session(
+                                if response_text:
+                                    messages.append({
+                                        "role": "assistant",
+                                        "content": response_text,
+                                        "agent_name": agent_name,
+                                        "tool_calls": tool_calls_to_log,
+                                        "meta": {**base_meta, "result_type": str(type(result))},
+                                        "task_id": task_id,
+                                    })
+                                await log_queue.put(dict(
                                     session_id=session_id,
-                                    agent_name=task.agent.name,
-                                    user_query=operations_query,
-                                    agent_response=getattr(result, 'response', str(result)),
-                                    tool_calls=tool_calls_to_log,
-                                    execution_time_ms=None,
-                                    success=True,
-                                    error_message=None,
-                                    meta={
-                                        "task_id": task.identifier,
-                                        "task_description": task.description,
-                                        "operations": task.operations,
-                                        "dependencies": task.dependencies,
-                                        "root_id": root_id,
-                                    }
-                                )
+                                    messages=messages,
+                                    agent_sessions=[{
+                                        "agent_name": agent_name,
+                                        "user_query": operations_query,
+                                        "agent_response": response_text,
+                                        "tool_calls": tool_calls_to_log,
+                                        "execution_time_ms": None,
+                                        "success": True,
+                                        "error_message": None,
+                                        "meta": base_meta,
+                                    }],
+                                    root_id=root_id,
+                                ))
                     except asyncio.TimeoutError:
                         error_msg = f"Task execution timed out after {TIMEOUT_TASK_EXECUTION} seconds"
-                        self.logger.info(f"Error: {error_msg}")
+                        self.logger.info("Error: %s", error_msg)
                         raise TronTimeoutError(
                             error_msg,
                             timeout=TIMEOUT_TASK_EXECUTION,
-                            operation=f"task_{task.identifier}"
+                            operation=f"task_{task_id}"
                         )
                     except Exception as e:
-                        self.logger.exception(
-                            f"Task '{task.identifier}' failed: {str(e)}"
-                        )
+                        self.logger.exception("Task '%s' failed: %s", task_id, e)
                         raise TaskError(
                             f"Task execution failed: {str(e)}",
                             context={
-                                "task_id": task.identifier,
+                                "task_id": task_id,
                                 "task_description": task.description,
                                 "error_type": type(e).__name__,
                                 "error_message": str(e)
@@ -216,7 +277,7 @@ class TaskExecutor:
                         )
                 else:
                     error_msg = f"No agent assigned to task: {task.identifier}"
-                    self.logger.debug(f"Error: {error_msg}")
+                    self.logger.debug("Error: %s", error_msg)
                     raise AgentError(
                         error_msg,
                         context={
@@ -227,7 +288,7 @@ class TaskExecutor:
 
                 task.done = True
             except Exception as e:
-                self.logger.exception(f"Task '{task.identifier}' failed: {str(e)}")
+                self.logger.exception("Task '%s' failed: %s", task.identifier, e)
                 task.error = str(e)
                 task.done = True
 
@@ -235,63 +296,110 @@ class TaskExecutor:
         for task in tasks:
             self.task_manager.add_task(task)
             self.logger.info(
-                f"Added task: '{task.identifier}': {task.description} with {len(task.operations)} operations"
+                "Added task: '%s': %s with %d operations",
+                task.identifier,
+                task.description,
+                len(task.operations),
             )
 
         # Log memory stats before execution
-        stats = self.task_manager.get_stats()
-        self.logger.info(
-            f"TaskManager stats before execution: "
-            f"total={stats['total_tasks']}, "
-            f"pending={stats['pending_tasks']}, "
-            f"memory_mb={stats['memory_usage_mb']:.2f}"
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            stats = self.task_manager.get_stats()
+            self.logger.info(
+                f"TaskManager stats before execution: "
+                f"total={stats['total_tasks']}, "
+                f"pending={stats['pending_tasks']}, "
+                f"memory_mb={stats['memory_usage_mb']:.2f}"
+            )
 
         # Execute all tasks
         self.logger.info("Starting task execution")
-        await self.task_manager.execute_all(task_handler)
+        try:
+            # Only this run's tasks; the manager also holds earlier and
+            # concurrent runs' tasks
+            await self.task_manager.execute_all(
+                task_handler,
+                concurrency=self.max_concurrent_tasks,
+                task_ids=[task.identifier for task in tasks],
+            )
+        finally:
+            if log_worker:
+                # Flush pending conversation writes before stopping the worker
+                await log_queue.join()
+                log_worker.cancel()
+                await asyncio.gather(log_worker, return_exceptions=True)
         self.logger.info("Task execution completed")
 
         # Log memory stats after execution
-        stats = self.task_manager.get_stats()
-        self.logger.info(
-            f"TaskManager stats after execution: "
-            f"total={stats['total_tasks']}, "
-            f"completed={stats['completed_tasks']}, "
-            f"memory_mb={stats['memory_usage_mb']:.2f}"
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            stats = self.task_manager.get_stats()
+            self.logger.info(
+                f"TaskManager stats after execution: "
+                f"total={stats['total_tasks']}, "
+                f"completed={stats['completed_tasks']}, "
+                f"memory_mb={stats['memory_usage_mb']:.2f}"
+            )
+
+        # Outcomes of this run only, in plan order; the manager also holds
+        # earlier and concurrent runs' tasks
+        completed_tasks: List[Task] = []
+        failed_tasks: List[Task] = []
+        for task in tasks:
+            if task.error:
+                failed_tasks.append(task)
+            elif task.done:
+                completed_tasks.append(task)
 
         # Check for failed tasks
-        failed_tasks = [t for t in self.task_manager.tasks if t.error]
         if failed_tasks:
-            error_details = []
-            for t in failed_tasks:
-                error_details.append({
+            error_details = [
+                {
                     "task_id": t.identifier,
                     "description": t.description,
                     "error": t.error
-                })
-                
+                }
+                for t in failed_tasks
+            ]
             raise TaskError(
                 f"Some tasks failed during execution: {len(failed_tasks)}",
                 context={
                     "failed_count": len(failed_tasks),
-                    "total_tasks": len(self.task_manager.tasks),
+                    "total_tasks": len(tasks),
                     "failed_tasks": error_details
                 }
             )
 
-        completed_tasks = [t for t in self.task_manager.tasks if t.done and not t.error]
-        self.logger.info(f"Successfully completed {len(completed_tasks)} tasks")
-
-        # At the end, close db_manager if used
-        if db_manager:
-            await db_manager.close()
+        self.logger.info("Successfully completed %d tasks", len(completed_tasks))
 
         return completed_tasks
 
+    def _llm_semaphore(self) -> asyncio.Semaphore:
+        """Returns the running loop's cap on concurrent agent LLM calls."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._llm_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._llm_semaphores[loop] = asyncio.Semaphore(self.max_concurrent_llm_calls)
+        return semaphore
+
+    async def _drain_log_queue(self, db_manager, queue: asyncio.Queue) -> None:
+        """Writes queued conversation rows to the database until cancelled.
+
+        Args:
+            db_manager: The `DatabaseManager` used to persist the rows.
+            queue: The run's log queue. Each item holds the keyword arguments
+                for `add_messages_batch`.
+        """
+        while True:
+            row = await queue.get()
+            try:
+                await db_manager.add_messages_batch(**row)
+            except Exception as e:
+                self.logger.error("Failed to log task messages: %s", e)
+            finally:
+                queue.task_done()
+
     def _build_operations_query(
-        self, task: Task, user_query: str, dependency_results: dict[str, str]
+        self, task: Task, user_query: str, dependency_results: dict[str, DependencyResult]
     ) -> str:
         """Constructs the detailed prompt for an agent to execute a task.
 
@@ -304,40 +412,86 @@ class TaskExecutor:
             task: The `Task` to be executed.
             user_query: The original user query.
             dependency_results: A dictionary mapping dependency task IDs to their
-                results.
+                descriptions and results.
 
         Returns:
             A formatted string containing the full prompt for the agent.
         """
-        operations_list = "\n".join(
-            f"{i + 1}. {op}" for i, op in enumerate(task.operations)
-        )
-
-        query_parts = [
-            f"Original Query: {user_query}\n",
-            f"Task Description: {task.description}\n",
-            f"\nOperations to perform in sequence:\n{operations_list}\n",
-        ]
+        buf: List[str] = []
+        append = buf.append
+        append(_QUERY_HEADER_TEMPLATE.format(
+            user_query=user_query, description=task.description
+        ))
+        append(task.rendered_operations())
         if dependency_results:
-            dep_sections = []
-            for dep_id, result in dependency_results.items():
-                # Use optimized get_task method (O(1) lookup)
-                try:
-                    dep_task = self.task_manager.get_task(dep_id)
-                    dep_sections.append(
-                        f"Dependency Task '{dep_id}':"
-                        f"\n- Description: {dep_task.description}"
-                        f"\n- Result:\n{result.response}\n"
-                    )
-                except KeyError:
-                    # Task not found, skip
-                    pass
-            if dep_sections:
-                query_parts.append("\nDependency Results:\n" + "\n".join(dep_sections))
+            append(_DEPENDENCY_RESULTS_HEADER)
+            # Fan-in dependencies often return the same text; include each
+            # distinct result once and point later duplicates at the first.
+            seen: dict[bytes, str] = {}
+            for i, (dep_id, dep) in enumerate(dependency_results.items()):
+                if i:
+                    append("\n")
+                append(_DEPENDENCY_SECTION_TEMPLATE.format(
+                    dep_id=dep_id, description=dep.description
+                ))
+                response = dep.result.response or ""
+                digest = hashlib.blake2b(
+                    response.encode("utf-8"), digest_size=16
+                ).digest()
+                if digest in seen:
+                    append(f"(identical to Dependency Task '{seen[digest]}')")
+                else:
+                    seen[digest] = dep_id
+                    append(truncate_tokens(
+                        response, self.max_dep_tokens, self.client.model
+                    ))
+                append("\n")
         if hasattr(task, 'context') and task.context:
-            query_parts.append(f"\nAdditional Repository Context:\n{task.context}\n")
-        
-        return "".join(query_parts)
+            append(f"\nAdditional Repository Context:\n{task.context}\n")
+
+        return "".join(buf)
+
+    def _result_cache_key(self, task: Task, agent_query: str) -> str:
+        """Builds the memoization key for an agent call.
+
+        Args:
+            task: The task being executed; its agent name, prompt and tool
+                signatures are part of the key.
+            agent_query: The full query sent to the agent.
+
+        Returns:
+            A hex digest identifying the (agent, prompt, tools, query) combination.
+        """
+        prompt_text = task.agent.prompt.text if task.agent.prompt else ""
+        tool_signatures = []
+        if task.agent.tool_manager:
+            for tool in task.agent.tool_manager.tools:
+                definition = tool.definition
+                tool_signatures.append(
+                    f"{definition.func_name}:{getattr(definition, 'func_desc', '') or ''}"
+                )
+        return hashlib.blake2b(
+            "\0".join(
+                (task.agent.name, prompt_text, *tool_signatures, agent_query)
+            ).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+
+    def _get_cached_result(self, key: str) -> Optional[Any]:
+        """Returns a memoized agent result and marks it as recently used."""
+        result = self._result_cache.get(key)
+        if result is not None:
+            self._result_cache.move_to_end(key)
+        return result
+
+    def _cache_result(self, key: str, result: Any) -> None:
+        """Memoizes an agent result, evicting the least recently used entries."""
+        if self._max_cached_results <= 0 or result is None:
+            return
+        self._result_cache[key] = result
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self._max_cached_results:
+            self._result_cache.popitem(last=False)
 
     def get_stats(self) -> dict:
         """Retrieves execution statistics from the underlying task manager.
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, List
 
 class BaseFlow(ABC):
     def __init__(self, name: str, description: str):
@@ -8,4 +9,28 @@ class BaseFlow(ABC):
 
     @abstractmethod
     def execute(self, *args, **kwargs) -> Any:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    async def run_many(self, queries: List[str], max_concurrency: int = 4) -> List[Any]:
+        """Execute the flow for several queries concurrently.
+
+        The LLM calls of separate runs overlap instead of queuing behind each
+        other; `max_concurrency` bounds how many runs are in flight at once.
+
+        Returns:
+            The results, in the same order as `queries`.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(query: str) -> Any:
+            async with semaphore:
+                return await self.execute(query)
+
+        return list(await asyncio.gather(*(run_one(query) for query in queries)))
+
+    async def aclose(self) -> None:
+        """Release resources bound to the running event loop. Call before the loop shuts down."""
+        # Lazy import: flows that never log to the database don't load SQLAlchemy
+        from tron_ai.database.manager import close_db_manager
+
+        await close_db_manager()
@@ -1,22 +1,44 @@
 import asyncio
+import hashlib
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
 import os
-import requests
+import time
+import weakref
+import aiohttp
 import json
 import logging
-from tron_ai.models.prompts import Prompt, PromptDefaultResponse
+from tron_ai.models.prompts import BasePromptResponse, Prompt, PromptDefaultResponse
 from tron_ai.utils.llm.LLMClient import get_llm_client_from_config, LLMClientConfig
 from tron_ai.models.executors import ExecutorConfig
 from tron_ai.utils.graph.graph import StateGraph
 from tron_ai.flows._base import BaseFlow
-from pydantic import BaseModel, Field
-from typing import Any, Dict, List
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_random_exponential,
+)
 from tron_ai.executors.completion import CompletionExecutor
 from tron_ai.models.config import ChatGPT5HighConfig
+from tron_ai.utils.llm.semantic_cache import embed_texts
+from tron_ai.utils.io import json as json_utils
+from tron_ai.utils.http.async_client import close_client, get_client
+from tron_ai.utils.io.file_manager_async import read_file_async, write_file_async
 
 logger = logging.getLogger(__name__)
 
 
 class PostState(BaseModel):
+    # Nodes assign fields directly on the shared state; keep that free of
+    # per-assignment validation (the pydantic default, made explicit here)
+    model_config = ConfigDict(validate_assignment=False, extra="ignore")
+    
     user_query: str = ""
     concept: str = ""
     
@@ -33,6 +55,32 @@ class PostState(BaseModel):
     
     
 
+class PostMetadataResponse(BasePromptResponse):
+    meta_description: str = Field(default="", description="Meta description of 150-160 characters for search results")
+    keywords: List[str] = Field(default_factory=list, description="5-8 SEO keywords")
+    tags: List[str] = Field(default_factory=list, description="3-5 categorization tags")
+    
+    @staticmethod
+    def example() -> dict:
+        return {
+            "meta_description": "A concise summary of the blog post that encourages readers to click through from search results.",
+            "keywords": ["keyword one", "keyword two"],
+            "tags": ["Tag One", "Tag Two"]
+        }
+
+
+class ArticleBundleResponse(PostMetadataResponse):
+    title: str = Field(default="", description="Title of the blog post")
+    content: str = Field(default="", description="Blog post content in Markdown, without the title")
+    
+    @staticmethod
+    def example() -> dict:
+        return {
+            "title": "A Compelling Blog Post Title",
+            "content": "# Introduction\n\nThe blog post content in Markdown...",
+        } | PostMetadataResponse.example()
+
+
 llm_client = None
 
 def get_llm_client():
@@ -42,6 +90,272 @@ def get_llm_client():
     return llm_client
 
 
+content_llm_client = None
+
+def get_content_llm_client():
+    global content_llm_client
+    if content_llm_client is None:
+        content_llm_client = get_llm_client_from_config(ChatGPT5HighConfig(reasoning_effort="low", text_verbosity="low"))
+    return content_llm_client
+
+
+# Executors are stateless apart from their client and prompt, so each node's
+# executor is built once and shared across flow runs
+@lru_cache(maxsize=None)
+def get_concept_executor() -> CompletionExecutor:
+    prompt = Prompt(
+        text="""
+        You are a professional content writer, specializing in taking a simple idea and generating a concept for a blog post. Return a single paragraph of text that captures the essence of the idea.
+        """,
+        output_format=PromptDefaultResponse
+    )
+    return CompletionExecutor(config=ExecutorConfig(client=get_llm_client(), prompt=prompt, semantic_cache=True))
+
+
+@lru_cache(maxsize=None)
+def get_title_executor() -> CompletionExecutor:
+    prompt = Prompt(
+        text="""
+        You are a professional content writer, specializing in taking a simple idea and generating a title for a blog post. Return only the title as a string without any quotes or formatting, nothing else.
+        """,
+        output_format=PromptDefaultResponse
+    )
+    return CompletionExecutor(config=ExecutorConfig(client=get_llm_client(), prompt=prompt, semantic_cache=True))
+
+
+@lru_cache(maxsize=None)
+def get_metadata_executor() -> CompletionExecutor:
+    prompt = Prompt(
+        text="""
+        You are an SEO specialist and content categorization expert. Based on the concept, research, and title of a blog post, generate:
+        - meta_description: a compelling meta description (150-160 characters) that accurately summarizes the blog post and encourages clicks from search results.
+        - keywords: 5-8 relevant SEO keywords that would help this blog post rank well in search engines.
+        - tags: 3-5 relevant tags that would help categorize this blog post.
+        """,
+        output_format=PostMetadataResponse
+    )
+    return CompletionExecutor(config=ExecutorConfig(client=get_llm_client(), prompt=prompt))
+
+
+@lru_cache(maxsize=None)
+def get_content_executor() -> CompletionExecutor:
+    prompt = Prompt(
+        text="""
+        You are a professional content writer, specializing in taking a simple idea, a title, and a concept and generating a blog post. Return only the blog post content, nothing else. The content should be in Markdown format (not HTML). Do NOT include the title in the content - the title will be handled separately. Use the provided research as reference material. Do not include any images in the content.
+        
+        Use Markdown formatting:
+        - **Bold** for emphasis
+        - *Italic* for subtle emphasis
+        - # Headers for sections
+        - - Bullet points for lists
+        - [Link text](URL) for links
+        - ![Alt text](image_url) for images
+        """,
+        output_format=PromptDefaultResponse
+    )
+    return CompletionExecutor(config=ExecutorConfig(client=get_content_llm_client(), prompt=prompt, semantic_cache=True))
+
+
+PEXELS_SEARCH_URL = 'https://api.pexels.com/v1/search'
+PEXELS_SEARCH_PARAMS = {
+    'per_page': 5,  # Get 5 relevant images
+    'orientation': 'landscape'  # Good for blog banners
+}
+PERPLEXITY_URL = 'https://api.perplexity.ai/chat/completions'
+# generate_research stores failures in state.research with this prefix
+RESEARCH_ERROR_PREFIX = 'Error: '
+
+
+@lru_cache(maxsize=None)
+def get_article_bundle_executor() -> CompletionExecutor:
+    prompt = Prompt(
+        text="""
+        You are a professional content writer and SEO specialist. From a blog post concept and research, produce the complete post:
+        - title: the title as plain text without any quotes or formatting.
+        - content: the blog post in Markdown format (not HTML). Do NOT include the title in the content. Use the provided research as reference material. Do not include any images in the content. Use **bold**, *italic*, # headers, bullet lists and [links](URL).
+        - meta_description: a compelling meta description (150-160 characters) that accurately summarizes the blog post and encourages clicks from search results.
+        - keywords: 5-8 relevant SEO keywords that would help this blog post rank well in search engines.
+        - tags: 3-5 relevant tags that would help categorize this blog post.
+        """,
+        output_format=ArticleBundleResponse
+    )
+    return CompletionExecutor(config=ExecutorConfig(client=get_content_llm_client(), prompt=prompt, semantic_cache=True))
+
+
+# Pexels search results and finished posts are cached on disk as
+# {expires_at, result}, keyed by a hash of their inputs
+PEXELS_CACHE_DIR = os.path.join(".cache", "pexels")
+PEXELS_CACHE_TTL = 24 * 60 * 60
+POST_CACHE_DIR = os.path.join(".cache", "wordpress_posts")
+POST_CACHE_TTL = 24 * 60 * 60
+
+def pexels_cache_path(params: Dict[str, Any]) -> str:
+    key = f"{params['query']}|{params['per_page']}|{params['orientation']}"
+    return os.path.join(PEXELS_CACHE_DIR, f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json")
+
+
+def post_cache_path(query: str, variant: str) -> str:
+    key = f"{variant}\x00{query}"
+    return os.path.join(POST_CACHE_DIR, f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json")
+
+
+async def read_cache_entry(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        cached = json_utils.loads(await read_file_async(path))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("⚠️ Ignoring unreadable cache entry %s: %s", path, e)
+        return None
+    if cached.get('expires_at', 0) <= time.time():
+        return None
+    return cached.get('result')
+
+
+async def write_cache_entry(path: str, result: Dict[str, Any], ttl: float) -> None:
+    try:
+        await write_file_async(path, json_utils.dumps({'expires_at': time.time() + ttl, 'result': result}))
+    except OSError as e:
+        logger.warning("⚠️ Could not write cache entry %s: %s", path, e)
+
+
+# Cache writes run in the background; the sets keep the tasks referenced until
+# done. Tasks belong to the loop that created them, so each running loop (e.g.
+# separate asyncio.run calls) tracks its own.
+_pending_writes: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, set]" = weakref.WeakKeyDictionary()
+
+def schedule_write(coro: Awaitable[None]) -> None:
+    pending = _pending_writes.setdefault(asyncio.get_running_loop(), set())
+    task = asyncio.create_task(coro)
+    pending.add(task)
+    task.add_done_callback(pending.discard)
+
+
+async def flush_pending_writes() -> None:
+    """Wait for the running loop's background cache writes; call before the loop shuts down."""
+    pending = _pending_writes.pop(asyncio.get_running_loop(), None)
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+# Outbound calls are capped per provider so parallel nodes and flows don't
+# trip rate limits or exhaust sockets
+PROVIDER_CONCURRENCY = {
+    'openai': int(os.getenv('TRON_OPENAI_MAX_CONCURRENCY', '8')),
+    'perplexity': int(os.getenv('TRON_PERPLEXITY_MAX_CONCURRENCY', '2')),
+    'pexels': int(os.getenv('TRON_PEXELS_MAX_CONCURRENCY', '4')),
+}
+# Semaphores are bound to the loop they first wait on, so each running loop
+# (e.g. separate asyncio.run calls) gets its own set
+_provider_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+
+def provider_semaphore(provider: str) -> asyncio.Semaphore:
+    semaphores = _provider_semaphores.setdefault(asyncio.get_running_loop(), {})
+    if provider not in semaphores:
+        semaphores[provider] = asyncio.Semaphore(PROVIDER_CONCURRENCY[provider])
+    return semaphores[provider]
+
+
+def is_retryable_response(e: BaseException) -> bool:
+    """Rate limits and server errors are worth retrying; other failures are not."""
+    return isinstance(e, aiohttp.ClientResponseError) and (e.status == 429 or e.status >= 500)
+
+
+# Seconds a request may spend retrying before its last error is raised. Each
+# graph node gets NODE_TIMEOUT, which leaves room for a full retry budget plus
+# the request itself (DEFAULT_TIMEOUT in the shared HTTP client) and the LLM
+# calls sharing the node.
+HTTP_RETRY_BUDGET = 60
+NODE_TIMEOUT = 300
+
+@retry(
+    wait=wait_random_exponential(min=1, max=30),
+    stop=stop_after_attempt(5) | stop_after_delay(HTTP_RETRY_BUDGET),
+    retry=retry_if_exception(is_retryable_response),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True,
+)
+async def request_body(provider: str, method: str, url: str, **kwargs: Any) -> bytes:
+    """Send a request through the shared session and return the raw response body."""
+    # The slot is held per attempt, not across the backoff between attempts
+    async with provider_semaphore(provider):
+        async with get_client().request(method, url, **kwargs) as response:
+            logger.info("📡 %s HTTP response status: %s", provider, response.status)
+            response.raise_for_status()
+            return await response.read()
+
+
+async def run_completion(executor: CompletionExecutor, query: str) -> Any:
+    """Run one of the flow's completions under the OpenAI concurrency limit."""
+    async with provider_semaphore('openai'):
+        return await executor.execute(query)
+
+
+# Banner lookups that ended without an image, counted by reason
+banner_fallbacks: Counter = Counter()
+
+def banner_fallback(state: PostState, reason: str, message: str) -> PostState:
+    """Record why no banner was selected; finalize_content then publishes the post without one."""
+    banner_fallbacks[reason] += 1
+    logger.warning("❌ %s", message)
+    state.banner_image = {"error": message}
+    return state
+
+
+# Fields kept from a Pexels photo; itemgetter pulls them in one call and
+# raises KeyError for a malformed photo, like the explicit lookups did
+PHOTO_FIELDS = ('id', 'photographer', 'photographer_url', 'alt')
+PHOTO_SRC_FIELDS = ('original', 'large')
+_get_photo_fields = itemgetter(*PHOTO_FIELDS)
+_get_photo_src_fields = itemgetter(*PHOTO_SRC_FIELDS)
+
+def compact_photo(photo: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the Pexels photo fields used to build the banner."""
+    compact = dict(zip(PHOTO_FIELDS, _get_photo_fields(photo)))
+    compact['src'] = dict(zip(PHOTO_SRC_FIELDS, _get_photo_src_fields(photo['src'])))
+    return compact
+
+
+async def select_banner_photo(photos: List[Dict[str, Any]], query: str) -> Dict[str, Any]:
+    """Pick the photo whose alt text is closest to the query, using the shared embedding model."""
+    if len(photos) == 1:
+        return photos[0]
+    embeddings = await embed_texts([query] + [photo.get('alt') or '' for photo in photos])
+    if embeddings is None:
+        # Pexels orders results by relevance, so the first is the best guess
+        return photos[0]
+    scores = embeddings[1:] @ embeddings[0]
+    return photos[int(scores.argmax())]
+
+
+# Pexels alt text and names are free text; escape the characters that would
+# close a Markdown link label, and percent-encode those that would end its URL
+_MARKDOWN_LABEL_ESCAPES = str.maketrans({'\\': '\\\\', '[': '\\[', ']': '\\]'})
+_MARKDOWN_URL_ESCAPES = str.maketrans({' ': '%20', '(': '%28', ')': '%29'})
+
+def build_banner_markdown(banner_image: Dict[str, Any]) -> str:
+    """Render the Markdown banner with attribution, or "" if the image has no usable URL."""
+    # Prefer the large rendition, fall back to the original
+    src = banner_image.get('src') or {}
+    image_url = src.get('large') or src.get('original')
+    if not image_url:
+        return ""
+    
+    alt_text = (banner_image.get('alt') or 'Blog post banner image').translate(_MARKDOWN_LABEL_ESCAPES)
+    photographer = (banner_image.get('photographer') or 'Unknown').translate(_MARKDOWN_LABEL_ESCAPES)
+    photographer_url = (banner_image.get('photographer_url') or '#').translate(_MARKDOWN_URL_ESCAPES)
+    image_url = image_url.translate(_MARKDOWN_URL_ESCAPES)
+    logger.debug("🔗 Banner image URL: %s", image_url)
+    
+    return f'''![{alt_text}]({image_url})
+
+*Photo by [{photographer}]({photographer_url}) on Pexels*
+
+---
+
+'''
+
+
 class WordpressGeneratePostTools:
     @staticmethod
     async def generate_concept(state: PostState) -> PostState:
@@ -49,25 +363,18 @@ class WordpressGeneratePostTools:
         logger.info("🎯 Starting concept generation...")
         # Pull the user query from the state
         user_query = state.user_query
-        logger.info(f"📝 User query: {user_query}")
+        logger.info("📝 User query: %s", user_query)
         
-        prompt = Prompt(
-            text="""
-            You are a professional content writer, specializing in taking a simple idea and generating a concept for a blog post. Return a single paragraph of text that captures the essence of the idea.
-            """,
-            output_format=PromptDefaultResponse
-        )
-        logger.info("🤖 Creating completion executor for concept generation...")
-        executor = CompletionExecutor(config=ExecutorConfig(client=get_llm_client(), prompt=prompt))
         logger.info("📡 Executing concept generation prompt...")
-        request = await executor.execute(
+        request = await run_completion(
+            get_concept_executor(),
             f"""
             {user_query}
-            """
+            """,
         )
         
         state.concept = request.response
-        logger.info(f"✅ Concept generated: {state.concept}")
+        logger.info("✅ Concept generated: %s", state.concept)
     
         return state
     
@@ -75,93 +382,45 @@ class WordpressGeneratePostTools:
     async def generate_title(state: PostState) -> PostState:
         """Generate a title for the blog post."""
         logger.info("📰 Starting title generation...")
-        logger.info(f"💡 Using concept: {state.concept}")
-        prompt = Prompt(
-            text="""
-            You are a professional content writer, specializing in taking a simple idea and generating a title for a blog post. Return only the title as a string without any quotes or formatting, nothing else.
-            """,
-            output_format=PromptDefaultResponse
-        )
-        logger.info("🤖 Creating completion executor for title generation...")
-        executor = CompletionExecutor(config=ExecutorConfig(client=get_llm_client(), prompt=prompt))
+        logger.info("💡 Using concept: %s", state.concept)
         logger.info("📡 Executing title generation prompt...")
-        request = await executor.execute(
+        request = await run_completion(
+            get_title_executor(),
             f"""
             {state.concept}
-            """
+            """,
         )
         
         state.title = request.response
-        logger.info(f"✅ Title generated: {state.title}")
+        logger.info("✅ Title generated: %s", state.title)
         
         # Return the state
         return state
     
     @staticmethod
-    async def generate_keywords(state: PostState) -> PostState:
-        """Generate SEO keywords for the blog post."""
-        logger.info("🎯 Starting keywords generation...")
-        logger.info(f"💡 Using concept: {state.concept}")
-        logger.info(f"📰 Using title: {state.title}")
-        logger.info(f"📄 Using content length: {len(state.content)} characters")
-        
-        prompt = Prompt(
-            text="""
-            You are an SEO specialist. Based on the concept, title, and content, generate 5-8 relevant SEO keywords that would help this blog post rank well in search engines. Return only the keywords as a comma-separated list, nothing else.
-            """,
-            output_format=PromptDefaultResponse
-        )
-        logger.info("🤖 Creating completion executor for keywords generation...")
-        executor = CompletionExecutor(config=ExecutorConfig(client=get_llm_client(), prompt=prompt))
-        logger.info("📡 Executing keywords generation prompt...")
-        request = await executor.execute(
+    async def generate_metadata(state: PostState) -> PostState:
+        """Generate the meta description, SEO keywords and tags for the blog post in one call."""
+        logger.info("🏷️ Starting metadata generation...")
+        logger.info("💡 Using concept: %s", state.concept)
+        logger.info("📰 Using title: %s", state.title)
+        logger.info("🔍 Using research length: %s characters", len(state.research))
+        
+        logger.info("📡 Executing metadata generation prompt...")
+        request = await run_completion(
+            get_metadata_executor(),
             f"""
             <concept>{state.concept}</concept>
+            <research>{state.research}</research>
             <title>{state.title}</title>
-            <content>{state.content}</content>
-            """
-        )
-        
-        # Parse the comma-separated keywords into a list
-        keywords_text = request.response.strip()
-        logger.info(f"📝 Raw keywords response: {keywords_text}")
-        state.keywords = [keyword.strip() for keyword in keywords_text.split(',') if keyword.strip()]
-        logger.info(f"✅ Keywords generated: {state.keywords}")
-        
-        return state
-    
-    @staticmethod
-    async def generate_tags(state: PostState) -> PostState:
-        """Generate relevant tags for the blog post."""
-        logger.info("🏷️ Starting tags generation...")
-        logger.info(f"💡 Using concept: {state.concept}")
-        logger.info(f"📰 Using title: {state.title}")
-        logger.info(f"📄 Using content length: {len(state.content)} characters")
-        logger.info(f"🎯 Using keywords: {state.keywords}")
-        
-        prompt = Prompt(
-            text="""
-            You are a content categorization expert. Based on the concept, title, content, and keywords, generate 3-5 relevant tags that would help categorize this blog post. Return only the tags as a comma-separated list, nothing else.
             """,
-            output_format=PromptDefaultResponse
-        )
-        logger.info("🤖 Creating completion executor for tags generation...")
-        executor = CompletionExecutor(config=ExecutorConfig(client=get_llm_client(), prompt=prompt))
-        logger.info("📡 Executing tags generation prompt...")
-        request = await executor.execute(
-            f"""
-            <concept>{state.concept}</concept>
-            <title>{state.title}</title>
-            <content>{state.content}</content>
-            <keywords>{', '.join(state.keywords)}</keywords>
-            """
         )
         
-        # Parse the comma-separated tags into a list
-        tags_text = request.response.strip()
-        logger.info(f"📝 Raw tags response: {tags_text}")
-        state.tags = [tag.strip() for tag in tags_text.split(',') if tag.strip()]
-        logger.info(f"✅ Tags generated: {state.tags}")
+        state.meta_description = request.meta_description.strip()
+        state.keywords = [keyword.strip() for keyword in request.keywords if keyword.strip()]
+        state.tags = [tag.strip() for tag in request.tags if tag.strip()]
+        logger.info("✅ Meta description generated (%s chars): %s", len(state.meta_description), state.meta_description)
+        logger.info("✅ Keywords generated: %s", state.keywords)
+        logger.info("✅ Tags generated: %s", state.tags)
         
         return state
     
@@ -169,70 +428,53 @@ class WordpressGeneratePostTools:
     async def generate_content(state: PostState) -> PostState:
         """Generate the content for the blog post."""
         logger.info("📄 Starting content generation...")
-        logger.info(f"💡 Using concept: {state.concept}")
-        logger.info(f"📰 Using title: {state.title}")
-        logger.info(f"📝 Using user query: {state.user_query}")
+        logger.info("💡 Using concept: %s", state.concept)
+        logger.info("📰 Using title: %s", state.title)
+        logger.info("📝 Using user query: %s", state.user_query)
         
-        prompt = Prompt(
-            text="""
-            You are a professional content writer, specializing in taking a simple idea, a title, and a concept and generating a blog post. Return only the blog post content, nothing else. The content should be in Markdown format (not HTML). Do NOT include the title in the content - the title will be handled separately. Use the provided research as reference material. Do not include any images in the content.
-            
-            Use Markdown formatting:
-            - **Bold** for emphasis
-            - *Italic* for subtle emphasis
-            - # Headers for sections
-            - - Bullet points for lists
-            - [Link text](URL) for links
-            - ![Alt text](image_url) for images
-            """,
-            output_format=PromptDefaultResponse
-        )
-        logger.info("🤖 Creating completion executor for content generation...")
-        executor = CompletionExecutor(config=ExecutorConfig(client=get_llm_client_from_config(ChatGPT5HighConfig(reasoning_effort="low", text_verbosity="low")), prompt=prompt))
         logger.info("📡 Executing content generation prompt...")
-        request = await executor.execute(
+        request = await run_completion(
+            get_content_executor(),
             f"""
             Write a blog post about the following:
             <concept>{state.concept}</concept>
             <research>{state.research}</research>
             <title>{state.title}</title>
             <user_query>{state.user_query}</user_query>
-            """
+            """,
         )
         
         state.content = request.response
-        logger.info(f"✅ Content generated: {len(state.content)} characters")
+        logger.info("✅ Content generated: %s characters", len(state.content))
         return state
     
     @staticmethod
-    async def generate_meta_description(state: PostState) -> PostState:
-        """Generate a meta description for the blog post."""
-        logger.info("📝 Starting meta description generation...")
-        logger.info(f"💡 Using concept: {state.concept}")
-        logger.info(f"📰 Using title: {state.title}")
-        logger.info(f"📄 Using content length: {len(state.content)} characters")
-        
-        prompt = Prompt(
-            text="""
-            You are an SEO specialist. Based on the concept, title, and content, generate a compelling meta description (150-160 characters) that accurately summarizes the blog post and encourages clicks from search results. Return only the meta description, nothing else.
-            """,
-            output_format=PromptDefaultResponse
-        )
-        logger.info("🤖 Creating completion executor for meta description generation...")
-        executor = CompletionExecutor(config=ExecutorConfig(client=get_llm_client(), prompt=prompt))
-        logger.info("📡 Executing meta description generation prompt...")
-        request = await executor.execute(
+    async def generate_article_bundle(state: PostState) -> PostState:
+        """Generate the title, content and SEO metadata for the blog post in one call."""
+        logger.info("📦 Starting fused article generation...")
+        logger.info("💡 Using concept: %s", state.concept)
+        logger.info("📝 Using user query: %s", state.user_query)
+        
+        logger.info("📡 Executing fused article generation prompt...")
+        request = await run_completion(
+            get_article_bundle_executor(),
             f"""
+            Write a blog post about the following:
             <concept>{state.concept}</concept>
-            <title>{state.title}</title>
-            <content>{state.content}</content>
-            """
+            <research>{state.research}</research>
+            <user_query>{state.user_query}</user_query>
+            """,
         )
         
-        state.meta_description = request.response.strip()
-        logger.info(f"✅ Meta description generated ({len(state.meta_description)} chars): {state.meta_description}")
+        state.title = request.title
+        state.content = request.content
+        state.meta_description = request.meta_description.strip()
+        state.keywords = [keyword.strip() for keyword in request.keywords if keyword.strip()]
+        state.tags = [tag.strip() for tag in request.tags if tag.strip()]
+        logger.info("✅ Article generated: %s (%s characters)", state.title, len(state.content))
+        
         return state
-
+    
     @staticmethod
     async def generate_banner_image(state: PostState) -> PostState:
         """Fetch a banner image from Pexels API based on the generated keywords."""
@@ -240,112 +482,99 @@ class WordpressGeneratePostTools:
         
         # Check if we have keywords to search with
         if not state.keywords:
-            logger.warning("❌ No keywords available for image search")
-            state.banner_image = {"error": "No keywords available for image search"}
-            return state
+            return banner_fallback(state, "no_keywords", "No keywords available for image search")
         
         logger.info("🔑 Checking Pexels API key...")
         api_key = os.getenv('PEXELS_API_KEY')
         if not api_key:
-            logger.error("❌ PEXELS_API_KEY not set")
-            state.banner_image = {"error": "PEXELS_API_KEY not set"}
-            return state
+            return banner_fallback(state, "no_api_key", "PEXELS_API_KEY not set")
         
-        logger.info(f"✅ Pexels API key found: {api_key[:8]}...{api_key[-4:] if len(api_key) > 12 else 'short'}")
+        logger.info("✅ Pexels API key found: %s...%s", api_key[:8], api_key[-4:] if len(api_key) > 12 else 'short')
         
         # Use the first few keywords as search query
         search_query = ' '.join(state.keywords[:3])  # Limit to first 3 keywords
-        logger.info(f"🔍 Search query: '{search_query}'")
+        logger.info("🔍 Search query: '%s'", search_query)
         
-        url = 'https://api.pexels.com/v1/search'
+        url = PEXELS_SEARCH_URL
         headers = {
             'Authorization': api_key,
         }
-        params = {
-            'query': search_query,
-            'per_page': 5,  # Get 5 relevant images
-            'orientation': 'landscape'  # Good for blog banners
-        }
+        params = {'query': search_query, **PEXELS_SEARCH_PARAMS}
         
-        logger.info("🌐 Making Pexels API request...")
-        logger.debug(f"   URL: {url}")
-        logger.debug(f"   Headers: {headers}")
-        logger.debug(f"   Params: {params}")
+        cache_path = pexels_cache_path(params)
+        result = await read_cache_entry(cache_path)
+        fetched = False
         
         try:
-            logger.info("📡 Sending HTTP request to Pexels...")
-            response = requests.get(url, headers=headers, params=params)
-            logger.info(f"📡 HTTP response status: {response.status_code}")
-            
-            response.raise_for_status()
-            logger.info("✅ Pexels HTTP request successful")
-            
-            result = response.json()
-            logger.info(f"📊 Pexels API response received: {len(str(result))} characters")
+            if result is not None:
+                logger.info("♻️ Using cached Pexels search results")
+            else:
+                logger.info("🌐 Making Pexels API request...")
+                logger.debug("   URL: %s", url)
+                logger.debug("   Params: %s", params)
+                
+                logger.info("📡 Sending HTTP request to Pexels...")
+                body = await request_body('pexels', 'GET', url, headers=headers, params=params)
+                logger.info("✅ Pexels HTTP request successful")
+                # Size the raw payload rather than re-stringifying the parsed result
+                logger.info("📊 Pexels API response received: %s bytes", len(body))
+                result = json_utils.loads(body)
+                fetched = True
             
             if 'photos' in result and result['photos']:
                 photos = result['photos']
-                logger.info(f"📸 Found {len(photos)} photos")
+                logger.info("📸 Found %s photos", len(photos))
                 
-                # Select the first image as the banner (most relevant)
-                photo = photos[0]
-                logger.info(f"🎯 Selected first photo: ID {photo.get('id', 'No ID')}")
+                # Trim every candidate to the fields the banner uses (cached
+                # candidates are already trimmed), dropping malformed photos
+                candidates = []
+                for photo in photos:
+                    try:
+                        candidates.append(compact_photo(photo))
+                    except (KeyError, TypeError) as e:
+                        logger.warning("⚠️ Skipping Pexels photo with missing data: %s", e)
                 
-                try:
-                    banner_data = {
-                        'id': photo['id'],
-                        'photographer': photo['photographer'],
-                        'photographer_url': photo['photographer_url'],
-                        'url': photo['url'],
-                        'src': {
-                            'original': photo['src']['original'],
-                            'large': photo['src']['large'],
-                            'medium': photo['src']['medium'],
-                            'small': photo['src']['small']
-                        },
-                        'alt': photo['alt'],
-                        'search_query': search_query
-                    }
-                    state.banner_image = banner_data
-                    logger.info("✅ Banner image selected successfully")
-                    logger.info(f"🖼️ Image: {photo.get('alt', 'No alt')} by {photo.get('photographer', 'Unknown')}")
+                if not candidates:
+                    banner_fallback(state, "bad_photo", "No usable photos in Pexels API response")
+                else:
+                    if fetched:
+                        # Cache the candidates rather than this post's pick, so
+                        # later posts with the same search rank them for themselves
+                        schedule_write(write_cache_entry(cache_path, {'photos': candidates}, PEXELS_CACHE_TTL))
                     
-                except KeyError as e:
-                    logger.error(f"❌ Missing key in photo: {e}")
-                    state.banner_image = {"error": f"Missing key in photo data: {e}"}
-                except Exception as e:
-                    logger.error(f"❌ Error processing photo: {str(e)}")
-                    state.banner_image = {"error": f"Error processing photo: {str(e)}"}
+                    photo = await select_banner_photo(candidates, f"{state.title} {' '.join(state.keywords)}")
+                    logger.info("🎯 Selected photo: ID %s", photo['id'])
+                    
+                    # A copy, so the candidate being cached doesn't gain the markdown
+                    state.banner_image = {**photo, 'markdown': build_banner_markdown(photo)}
+                    logger.info("✅ Banner image selected successfully")
+                    logger.info("🖼️ Image: %s by %s", photo['alt'], photo['photographer'])
             else:
-                logger.warning("❌ No photos found in Pexels response")
-                state.banner_image = {"error": "No photos found in Pexels API response"}
+                banner_fallback(state, "no_photos", "No photos found in Pexels API response")
         
-        except requests.exceptions.RequestException as e:
-            logger.error(f"❌ HTTP request error: {str(e)}")
-            state.banner_image = {"error": f"HTTP request failed - {str(e)}"}
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            banner_fallback(state, "http_error", f"HTTP request failed - {e}")
         except json.JSONDecodeError as e:
-            logger.error(f"❌ JSON decode error: {str(e)}")
-            state.banner_image = {"error": f"Invalid JSON response - {str(e)}"}
+            banner_fallback(state, "invalid_json", f"Invalid JSON response - {e}")
         except Exception as e:
-            logger.error(f"❌ Unexpected error during image fetching: {str(e)}")
-            state.banner_image = {"error": f"Unexpected error - {str(e)}"}
+            banner_fallback(state, "unexpected", f"Unexpected error - {e}")
         
-        logger.debug(f"📊 Final banner image state: {state.banner_image}")
+        logger.debug("📊 Final banner image state: %s", state.banner_image)
         return state
 
     @staticmethod
     async def generate_research(state: PostState) -> PostState:
         """Research the concept using Perplexity AI."""
         logger.info("🔍 Starting research phase...")
-        logger.info(f"📋 Research concept: {state.concept}")
+        logger.info("📋 Research concept: %s", state.concept)
         
         api_key = os.getenv('PERPLEXITY_API_KEY')
         if not api_key:
             logger.error("❌ PERPLEXITY_API_KEY not set")
-            state.research = "Error: PERPLEXITY_API_KEY not set."
+            state.research = f"{RESEARCH_ERROR_PREFIX}PERPLEXITY_API_KEY not set."
             return state
         
-        url = 'https://api.perplexity.ai/chat/completions'
+        url = PERPLEXITY_URL
         headers = {
             'Authorization': f'Bearer {api_key}',
             'Content-Type': 'application/json',
@@ -358,14 +587,12 @@ class WordpressGeneratePostTools:
         }
         
         try:
-            response = requests.post(url, headers=headers, json=data)
-            response.raise_for_status()
-            result = response.json()
+            result = json_utils.loads(await request_body('perplexity', 'POST', url, headers=headers, json=data))
             state.research = result['choices'][0]['message']['content']
-            logger.info(f"✅ Research completed: {len(state.research)} characters")
+            logger.info("✅ Research completed: %s characters", len(state.research))
         except Exception as e:
-            logger.error(f"❌ Error during research: {str(e)}")
-            state.research = f"Error: {str(e)}"
+            logger.error("❌ Error during research: %s", e)
+            state.research = f"{RESEARCH_ERROR_PREFIX}{str(e)}"
         
         return state
 
@@ -387,61 +614,65 @@ class WordpressGeneratePostTools:
         
         logger.info("✅ Content and banner image available for finalization")
         
-        # Get the banner image URL (prefer large, fallback to original)
-        image_url = None
-        if 'src' in state.banner_image:
-            src = state.banner_image['src']
-            image_url = src.get('large') or src.get('original')
-            logger.info(f"🔗 Selected image URL: {image_url}")
+        # The banner Markdown is rendered when the image is selected
+        image_markdown = state.banner_image.get('markdown')
+        if image_markdown is None:
+            image_markdown = build_banner_markdown(state.banner_image)
         
-        if not image_url:
+        if not image_markdown:
             logger.warning("⚠️ No suitable image URL found, using original content")
             state.finalized_content = state.content
             return state
         
-        # Get image details
         alt_text = state.banner_image.get('alt', 'Blog post banner image')
         photographer = state.banner_image.get('photographer', 'Unknown')
-        photographer_url = state.banner_image.get('photographer_url', '#')
-        
-        logger.info("📋 Image details:")
-        logger.debug(f"   - Alt text: {alt_text}")
-        logger.debug(f"   - Photographer: {photographer}")
-        logger.debug(f"   - Photographer URL: {photographer_url}")
-        
-        # Create Markdown image with attribution
-        logger.info("🏗️ Creating Markdown image...")
-        image_markdown = f'''![{alt_text}]({image_url})
-
-*Photo by [{photographer}]({photographer_url}) on Pexels*
-
----
-
-'''
-        
-        logger.info(f"✅ Markdown image tag created: {len(image_markdown)} characters")
         
         # Combine banner image with content
         logger.info("📝 Combining banner image with content...")
-        finalized_content = image_markdown + '\n\n' + state.content
+        # One join instead of two concatenations that each copy the article
+        finalized_content = ''.join((image_markdown, '\n\n', state.content))
         
         state.finalized_content = finalized_content
         
         logger.info("✅ Content finalized successfully")
-        logger.debug(f"📊 Original content length: {len(state.content)} characters")
-        logger.debug(f"📊 Finalized content length: {len(finalized_content)} characters")
-        logger.debug(f"📊 Content change: +{len(finalized_content) - len(state.content)} characters")
-        logger.info(f"🖼️ Banner image embedded: {alt_text} by {photographer}")
+        logger.debug("📊 Original content length: %s characters", len(state.content))
+        logger.debug("📊 Finalized content length: %s characters", len(finalized_content))
+        logger.debug("📊 Content change: +%s characters", len(finalized_content) - len(state.content))
+        logger.info("🖼️ Banner image embedded: %s by %s", alt_text, photographer)
         
         return state
 
+def gather_nodes(*nodes: Callable[[PostState], Awaitable[PostState]]) -> Callable[[PostState], Awaitable[PostState]]:
+    """Combine nodes that write disjoint state fields into one concurrent node."""
+    async def run(state: PostState) -> PostState:
+        await asyncio.gather(*(node(state) for node in nodes))
+        return state
+    return run
+
+
+def chain_nodes(*nodes: Callable[[PostState], Awaitable[PostState]]) -> Callable[[PostState], Awaitable[PostState]]:
+    """Combine dependent nodes into one node that runs them in order."""
+    async def run(state: PostState) -> PostState:
+        for node in nodes:
+            state = await node(state)
+        return state
+    return run
+
+
 class WordpressGeneratePost(BaseFlow):
-    def __init__(self):
+    def __init__(self, fuse_article_calls: bool = False):
+        """
+        Args:
+            fuse_article_calls: Generate the title, content and SEO metadata in a
+                single completion instead of three. Fewer calls and tokens, but the
+                banner lookup can no longer overlap the article.
+        """
         super().__init__(
             name = "WordpressGeneratePost",
             description = "Generate a blog post about the user's query"
         )
         
+        self.fuse_article_calls = fuse_article_calls
         self.graph = StateGraph[PostState]()
         self._add_nodes()
         self._add_edges()
@@ -452,42 +683,68 @@ class WordpressGeneratePost(BaseFlow):
         
     def _add_nodes(self):
         self.graph.add_node("generate_concept", WordpressGeneratePostTools.generate_concept)
-        self.graph.add_node("generate_title", WordpressGeneratePostTools.generate_title)
-        self.graph.add_node("generate_content", WordpressGeneratePostTools.generate_content)
-        self.graph.add_node("generate_meta_description", WordpressGeneratePostTools.generate_meta_description)
-        self.graph.add_node("generate_keywords", WordpressGeneratePostTools.generate_keywords)
-        self.graph.add_node("generate_tags", WordpressGeneratePostTools.generate_tags)
-        self.graph.add_node("generate_banner_image", WordpressGeneratePostTools.generate_banner_image)
-        self.graph.add_node("generate_research", WordpressGeneratePostTools.generate_research)
         self.graph.add_node("finalize_content", WordpressGeneratePostTools.finalize_content)
+        if self.fuse_article_calls:
+            self.graph.add_node("generate_research", WordpressGeneratePostTools.generate_research)
+            self.graph.add_node("generate_article_bundle", WordpressGeneratePostTools.generate_article_bundle)
+            self.graph.add_node("generate_banner_image", WordpressGeneratePostTools.generate_banner_image)
+            return
+        
+        # Nodes that only read fields already in the state run side by side
+        self.graph.add_node(
+            "generate_research_and_title",
+            gather_nodes(WordpressGeneratePostTools.generate_research, WordpressGeneratePostTools.generate_title),
+        )
+        # Metadata and the banner it keys only need the concept, research and
+        # title, so they run alongside the article itself
+        self.graph.add_node(
+            "generate_content_and_metadata",
+            gather_nodes(
+                WordpressGeneratePostTools.generate_content,
+                chain_nodes(WordpressGeneratePostTools.generate_metadata, WordpressGeneratePostTools.generate_banner_image),
+            ),
+        )
         
     def _add_edges(self):
-        self.graph.add_edge("generate_concept", "generate_research")
-        self.graph.add_edge("generate_research", "generate_title")
-        self.graph.add_edge("generate_title", "generate_content")
-        self.graph.add_edge("generate_content", "generate_meta_description")
-        self.graph.add_edge("generate_meta_description", "generate_keywords")
-        self.graph.add_edge("generate_keywords", "generate_tags")
-        self.graph.add_edge("generate_tags", "generate_banner_image")
-        self.graph.add_edge("generate_banner_image", "finalize_content")
+        if self.fuse_article_calls:
+            self.graph.add_edge("generate_concept", "generate_research")
+            self.graph.add_edge("generate_research", "generate_article_bundle")
+            self.graph.add_edge("generate_article_bundle", "generate_banner_image")
+            self.graph.add_edge("generate_banner_image", "finalize_content")
+        else:
+            self.graph.add_edge("generate_concept", "generate_research_and_title")
+            self.graph.add_edge("generate_research_and_title", "generate_content_and_metadata")
+            self.graph.add_edge("generate_content_and_metadata", "finalize_content")
         
         self.graph.set_entrypoint("generate_concept")
         self.graph.set_exit("finalize_content")
         
-    async def execute(self, query: str, *args, **kwargs) -> Any:
-        logger.info("🚀 Starting WordpressGeneratePost execution...")
-        logger.info(f"\t📝 Query: {query}")
-        logger.debug(f"\t🔧 Args: {args}")
-        logger.debug(f"\t🔑 Kwargs: {kwargs}")
-        
-        self.state.user_query = query
-        self.state = await self.graph.run(self.state)
+    async def execute_stream(self, query: str) -> AsyncIterator[Dict[str, Any]]:
+        """Run the flow, yielding progress as each node completes.
+        
+        Yields {"step": <node name>, "state": <state dump>} after every node,
+        then {"step": "result", "result": <post>} once the post is finished.
+        """
+        # Identical queries within the TTL reuse the finished post, as long as
+        # it was generated with the same settings
+        cache_path = post_cache_path(query, self._cache_variant())
+        cached = await read_cache_entry(cache_path)
+        if cached is not None:
+            logger.info("♻️ Returning cached blog post for this query")
+            yield {"step": "result", "result": cached}
+            return
+        
+        # Each run starts from a fresh state rather than the previous run's fields
+        state = PostState(user_query=query)
+        async for node_name, state in self.graph.run_iter(state, timeout=NODE_TIMEOUT):
+            yield {"step": node_name, "state": state.model_dump()}
+        self.state = state
         
         logger.debug("=== STATE ===")
         logger.debug(self.state)
         logger.debug("=== STATE ===")
         
-        return {
+        result = {
             "title": self.state.title,
             "content": self.state.finalized_content,
             "meta_description": self.state.meta_description,
@@ -497,6 +754,43 @@ class WordpressGeneratePost(BaseFlow):
                 When responding to the user, show them the title, meta description, tags, and keywords. If you do show them the content, make sure to show it in a code block, formatted in HTML.
             '''
         }
+        if self._is_cacheable(self.state):
+            schedule_write(write_cache_entry(cache_path, result, POST_CACHE_TTL))
+        
+        yield {"step": "result", "result": result}
+    
+    @staticmethod
+    def _is_cacheable(state: PostState) -> bool:
+        """Only cache complete posts; one written without research or a banner
+        would keep being served after the failure behind it has cleared."""
+        return (
+            bool(state.finalized_content)
+            and not state.research.startswith(RESEARCH_ERROR_PREFIX)
+            and 'error' not in state.banner_image
+        )
+    
+    def _cache_variant(self) -> str:
+        """Describe the settings that shape the post, for its cache key."""
+        models = (get_llm_client().model, get_content_llm_client().model)
+        return f"fused={self.fuse_article_calls}|models={','.join(models)}"
+    
+    async def aclose(self) -> None:
+        # Background cache writes and the shared HTTP session belong to this loop
+        await flush_pending_writes()
+        await close_client()
+        await super().aclose()
+    
+    async def execute(self, query: str, *args, **kwargs) -> Any:
+        logger.info("🚀 Starting WordpressGeneratePost execution...")
+        logger.info("\t📝 Query: %s", query)
+        logger.debug("\t🔧 Args: %s", args)
+        logger.debug("\t🔑 Kwargs: %s", kwargs)
+        
+        result = None
+        async for update in self.execute_stream(query):
+            if update["step"] == "result":
+                result = update["result"]
+        return result
         
         
 if __name__ == "__main__":
@@ -504,6 +798,13 @@ if __name__ == "__main__":
     from tron_ai.config import setup_logging
 
     setup_logging()
-    flow = WordpressGeneratePost()
-    results = asyncio.run(flow.execute("generate a blog post about LLM's and prompting, aim for an article that will take ~3 minutes to read,"))
-    print(results)
\ No newline at end of file
+
+    async def main():
+        flow = WordpressGeneratePost()
+        try:
+            return await flow.execute("generate a blog post about LLM's and prompting, aim for an article that will take ~3 minutes to read,")
+        finally:
+            await flow.aclose()
+
+    results = asyncio.run(main())
+    print(json_utils.pretty_dumps(results))
\ No newline at end of file
@@ -17,3 +17,7 @@ class ExecutorConfig(BaseModel):
     prompt: Optional[Prompt] = None
 
     logging: bool = False
+
+    # Reuse responses for near-duplicate queries (see tron_ai.utils.llm.semantic_cache).
+    # Only applies to calls without tools or prompt kwargs.
+    semantic_cache: bool = False
@@ -13,7 +13,7 @@ from tron_ai.utils.llm.LLMClient import get_llm_client
 from tron_ai.modules.a2a.executor import TronA2AExecutor
 from tron_ai.modules.a2a.session_manager import A2ASessionManager
 from tron_ai.database.manager import DatabaseManager
-from tron_ai.database.config import DatabaseConfig
+from tron_ai.database.config import get_db_config
 
 
 # Create agents
@@ -47,7 +47,7 @@ executor = AgentExecutor(
 )
 
 # Create database manager and session manager for A2A session continuity
-db_manager = DatabaseManager(DatabaseConfig())
+db_manager = DatabaseManager(get_db_config())
 session_manager = A2ASessionManager(db_manager=db_manager)
 
 # Create A2A executor with session continuity support
@@ -6,7 +6,7 @@ from uuid import uuid4
 from datetime import datetime, timezone
 
 from tron_ai.database.manager import DatabaseManager
-from tron_ai.database.config import DatabaseConfig
+from tron_ai.database.config import get_db_config
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +19,7 @@ class A2ASessionManager:
         Args:
             db_manager: Optional database manager instance. If not provided, creates one with default config.
         """
-        self.db_manager = db_manager or DatabaseManager(DatabaseConfig())
+        self.db_manager = db_manager or DatabaseManager(get_db_config())
         self._initialized = False
     
     async def initialize(self):
@@ -1,4 +1,4 @@
 from .manager import Manager
-from .models import Task, AgentAssignedTask
+from .models import Task, AgentAssignedTask, DependencyResult
 
-__all__ = ["Manager", "Task", "AgentAssignedTask"]
\ No newline at end of file
+__all__ = ["Manager", "Task", "AgentAssignedTask", "DependencyResult"]
\ No newline at end of file
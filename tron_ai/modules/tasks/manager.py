@@ -1,11 +1,12 @@
-from typing import Optional, List, Callable, Awaitable, Dict
+from typing import Optional, List, Callable, Awaitable, Dict, Iterable
 
 import asyncio
+from graphlib import CycleError, TopologicalSorter
 from heapq import heappush, heappop
 from collections import OrderedDict
 import weakref
 
-from tron_ai.modules.tasks.models import Task
+from tron_ai.modules.tasks.models import Task, DependencyResult
 
 
 class Manager:
@@ -22,7 +23,6 @@ class Manager:
         """
         # Use OrderedDict for O(1) lookups while maintaining insertion order
         self._tasks: OrderedDict[str, Task] = OrderedDict()
-        self._execution_order: List[List[Task]] = []
 
         # Performance optimization: track tasks by state
         self._pending_tasks: Dict[str, weakref.ref] = {}  # Weak refs to pending tasks
@@ -33,10 +33,6 @@ class Manager:
         self._result_size_limit = result_size_limit
         self._current_result_size = 0
 
-        # Cache for dependency graph
-        self._dependency_graph: Optional[Dict[str, List[str]]] = None
-        self._in_degree_cache: Optional[Dict[str, int]] = None
-
     @property
     def tasks(self) -> List[Task]:
         """Return all tasks as a list for backward compatibility."""
@@ -53,18 +49,14 @@ class Manager:
         if not task.done:
             self._pending_tasks[task.identifier] = weakref.ref(task)
 
-        # Invalidate caches
-        self._dependency_graph = None
-        self._in_degree_cache = None
-
-    def get_dependency_results(self, task: Task) -> dict[str, str]:
+    def get_dependency_results(self, task: Task) -> dict[str, DependencyResult]:
         """Get the results of all dependencies for a given task.
 
         Args:
             task: The task whose dependency results we want to retrieve
 
         Returns:
-            A dictionary mapping dependency task IDs to their results
+            A dictionary mapping dependency task IDs to their description and result
 
         Raises:
             ValueError: If any dependency has not completed or failed
@@ -80,7 +72,7 @@ class Manager:
                 raise ValueError(
                     f"Dependency task {dep_id} failed with error: {dep_task.error}"
                 )
-            results[dep_id] = dep_task.result
+            results[dep_id] = DependencyResult(dep_task.description, dep_task.result)
         return results
 
     def validate_dependencies(self):
@@ -91,48 +83,89 @@ class Manager:
                 if dep_id not in all_ids:
                     raise ValueError(f"Missing dependency: {dep_id}")
 
-    def prepare_execution_plan(self):
-        """Calculate the execution order groups"""
-        self.validate_dependencies()
-        self._execution_order = self._concurrent_topological_sort()
-        return self._execution_order
-
     async def execute_all(
         self,
-        task_handler: Callable[[Task, dict[str, str]], Awaitable[None]],
+        task_handler: Callable[[Task, dict[str, DependencyResult]], Awaitable[None]],
         concurrency: int = 10,
+        task_ids: Optional[Iterable[str]] = None,
     ):
-        """Execute all tasks with controlled concurrency
+        """Execute tasks with controlled concurrency
+
+        Scheduling is driven by a `graphlib.TopologicalSorter`: a task becomes
+        ready as soon as its last dependency finishes rather than waiting for
+        the whole previous dependency level to drain. Ready tasks wait in a
+        priority heap and are only started while fewer than `concurrency` are
+        in flight, so wide graphs never hold more than `concurrency` handlers
+        (and their results in progress) at once.
+
+        Only the tasks in `task_ids` are scheduled, so concurrent runs sharing
+        a manager never pick up each other's tasks. Dependencies on tasks
+        outside the run are not scheduled; they must already be complete when
+        the dependent task starts, or it fails its dependency check.
 
         Args:
             task_handler: Async function that takes a task and its dependency results dict
             concurrency: Maximum number of tasks to run concurrently
+            task_ids: Identifiers of the registered tasks to run. Defaults to
+                every registered task.
+
+        Raises:
+            ValueError: If a dependency is missing or a circular dependency is detected.
         """
-        if not self._execution_order:
-            self.prepare_execution_plan()
-
-        for group in self._execution_order:
-            semaphore = asyncio.Semaphore(concurrency)
-
-            async def run_with_semaphore(task):
-                async with semaphore:
-                    try:
-                        # Get dependency results before executing task
-                        dep_results = self.get_dependency_results(task)
-                        await task_handler(task, dep_results)
-                    except Exception as e:
-                        task.error = str(e)
-                        raise
-                    finally:
-                        # Mark task as done regardless of outcome
-                        task.done = True
-                        # Move task to completed and manage memory
-                        self._mark_task_completed(task)
-
-            await asyncio.gather(
-                *[run_with_semaphore(task) for task in group if not task.done],
-                return_exceptions=True
-            )
+        run_ids = list(self._tasks) if task_ids is None else list(task_ids)
+        run_id_set = set(run_ids)
+        graph: Dict[str, List[str]] = {}
+        for task_id in run_ids:
+            task = self._tasks.get(task_id)
+            if task is None:
+                raise KeyError(f"Task not found: {task_id}")
+            for dep_id in task.dependencies:
+                if dep_id not in self._tasks:
+                    raise ValueError(f"Missing dependency: {dep_id}")
+            graph[task_id] = [dep_id for dep_id in task.dependencies if dep_id in run_id_set]
+        sorter = TopologicalSorter(graph)
+        try:
+            sorter.prepare()
+        except CycleError as e:
+            raise ValueError("Circular dependency detected in tasks") from e
+
+        finished: asyncio.Queue[str] = asyncio.Queue()
+
+        async def run_task(task):
+            try:
+                # Get dependency results before executing task
+                dep_results = self.get_dependency_results(task)
+                await task_handler(task, dep_results)
+            except Exception as e:
+                # Recorded on the task; dependents fail on their own
+                # dependency check instead of cancelling siblings.
+                task.error = str(e)
+            finally:
+                # Mark task as done regardless of outcome
+                task.done = True
+                # Move task to completed and manage memory
+                self._mark_task_completed(task)
+                finished.put_nowait(task.identifier)
+
+        ready: List[tuple[int, str]] = []
+        in_flight = 0
+        async with asyncio.TaskGroup() as group:
+            while sorter.is_active():
+                for task_id in sorter.get_ready():
+                    task = self._tasks[task_id]
+                    if task.done:
+                        sorter.done(task_id)
+                    else:
+                        heappush(ready, (-task.priority, task_id))
+
+                while ready and in_flight < concurrency:
+                    _, task_id = heappop(ready)
+                    group.create_task(run_task(self._tasks[task_id]))
+                    in_flight += 1
+
+                if in_flight:
+                    sorter.done(await finished.get())
+                    in_flight -= 1
 
     def _mark_task_completed(self, task: Task):
         """Mark a task as completed and manage memory."""
@@ -172,73 +205,6 @@ class Manager:
                 self._current_result_size -= result_size
             oldest_task.result = "<Result cleared for memory optimization>"
 
-    def _build_dependency_graph(self) -> tuple[Dict[str, List[str]], Dict[str, int]]:
-        """Build and cache the dependency graph."""
-        if self._dependency_graph is None or self._in_degree_cache is None:
-            self._dependency_graph = {task_id: [] for task_id in self._tasks}
-            self._in_degree_cache = {task_id: 0 for task_id in self._tasks}
-
-            for task in self._tasks.values():
-                for dep in task.dependencies:
-                    self._dependency_graph[dep].append(task.identifier)
-                    self._in_degree_cache[task.identifier] += 1
-
-        return self._dependency_graph, self._in_degree_cache
-
-    def _concurrent_topological_sort(self) -> List[List[Task]]:
-        """Enhanced Kahn's algorithm implementation with priority queue for parallel groups.
-
-        Returns:
-            List[List[Task]]: List of task groups that can be executed in parallel,
-                            sorted by priority within each group.
-
-        Raises:
-            ValueError: If a circular dependency is detected.
-        """
-        # Use cached dependency graph
-        graph, in_degree = self._build_dependency_graph()
-
-        # Make a copy of in_degree for modification
-        in_degree = in_degree.copy()
-
-        # Initialize priority queue with tasks having no dependencies
-        # Using negative priority for max-heap behavior (higher priority first)
-        current_heap = []
-        for task_id, task in self._tasks.items():
-            if in_degree[task_id] == 0:
-                heappush(current_heap, (-task.priority, task_id, task))
-
-        sorted_groups = []
-
-        while current_heap:
-            current_level = []
-            next_heap = []
-
-            # Process all tasks at the current priority level
-            while current_heap:
-                _, _, task = heappop(current_heap)
-                current_level.append(task)
-
-                # Update in-degrees and add newly available tasks to next level
-                for neighbor_id in graph[task.identifier]:
-                    in_degree[neighbor_id] -= 1
-                    if in_degree[neighbor_id] == 0:
-                        neighbor_task = self._tasks[neighbor_id]
-                        heappush(
-                            next_heap,
-                            (-neighbor_task.priority, neighbor_id, neighbor_task),
-                        )
-
-            if current_level:
-                sorted_groups.append(current_level)
-            current_heap = next_heap
-
-        # Check for circular dependencies
-        if sum(len(group) for group in sorted_groups) != len(self._tasks):
-            raise ValueError("Circular dependency detected in tasks")
-
-        return sorted_groups
-
     def get_task(self, task_id: str) -> Task:
         """Retrieve a task by its identifier - O(1) lookup"""
         task = self._tasks.get(task_id)
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Any
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import List, Optional, Any, NamedTuple
 import os
 
 from tron_ai.models.agent import Agent
@@ -59,6 +59,22 @@ class Task(BaseModel):
         description="Priority level of the task (higher number means higher priority)",
     )
 
+    # Numbered operations text, cached with the operations it was rendered from
+    _rendered_operations: Optional[tuple[tuple[str, ...], str]] = PrivateAttr(default=None)
+
+    def rendered_operations(self) -> str:
+        """Return the operations as a numbered list, one operation per line.
+
+        The text is cached on the task and only rebuilt if the operations
+        change, so retries and re-runs reuse it.
+        """
+        key = tuple(self.operations)
+        cached = self._rendered_operations
+        if cached is None or cached[0] != key:
+            cached = (key, "".join(f"{i}. {op}\n" for i, op in enumerate(key, 1)))
+            self._rendered_operations = cached
+        return cached[1]
+
     def reset(self):
         """Reset task state for re-execution.
 
@@ -70,4 +86,16 @@ class Task(BaseModel):
         self.done = False
         
 class AgentAssignedTask(Task):
-    agent: Agent = Field(default=None, description="Agent that will execute all operations in this task.")
\ No newline at end of file
+    agent: Agent = Field(default=None, description="Agent that will execute all operations in this task.")
+
+
+class DependencyResult(NamedTuple):
+    """The outcome of a finished dependency, as passed to task handlers.
+
+    Attributes:
+        description (str): The dependency task's description.
+        result (Any): The dependency task's result.
+    """
+
+    description: str
+    result: Any
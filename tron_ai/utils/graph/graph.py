@@ -18,7 +18,7 @@ Example:
 """
 
 import asyncio
-from typing import Callable, Dict, Optional, Awaitable, TypeVar, Generic
+from typing import AsyncIterator, Callable, Dict, Optional, Awaitable, Tuple, TypeVar, Generic
 from pydantic import BaseModel
 from tron_ai.config import setup_logging
 import logging
@@ -104,6 +104,27 @@ class StateGraph(Generic[T]):
         Returns:
             Final state after execution completes
 
+        Raises:
+            The same errors as `run_iter`.
+        """
+        state = initial_state
+        async for _, state in self.run_iter(initial_state, timeout=timeout, max_cycles=max_cycles):
+            pass
+        return state
+
+    async def run_iter(
+        self, initial_state: T, timeout: float = 30.0, max_cycles: int = 100
+    ) -> AsyncIterator[Tuple[str, T]]:
+        """Execute the graph, yielding the state after each node completes.
+
+        Args:
+            initial_state: Initial state to process
+            timeout: Timeout in seconds for each node execution
+            max_cycles: Maximum number of node executions to prevent infinite loops
+
+        Yields:
+            Tuples of (node name, state after that node)
+
         Raises:
             ValueError: If entrypoint is not set
             RuntimeError: If no valid transition is found
@@ -130,14 +151,15 @@ class StateGraph(Generic[T]):
                 raise RecursionError(f"Maximum execution cycles ({max_cycles}) exceeded. Possible infinite loop.")
 
             node_fn = self.nodes[current_node]
-            self.logger.info(f"Executing node: {current_node} (cycle {execution_count})")
+            self.logger.info("Executing node: %s (cycle %s)", current_node, execution_count)
 
             # Execute with timeout
             try:
                 state = await asyncio.wait_for(node_fn(state), timeout=timeout)
             except asyncio.TimeoutError as e:
-                self.logger.error(f"Node {current_node} timed out after {timeout}s")
+                self.logger.error("Node %s timed out after %ss", current_node, timeout)
                 raise asyncio.TimeoutError(f"Node execution timeout: {current_node}") from e
+            yield current_node, state
 
             # Determine next node
             outgoing = self.edges.get(current_node, {})
@@ -161,17 +183,16 @@ class StateGraph(Generic[T]):
             if not found:
                 raise RuntimeError(f"No valid transition from {current_node} for state {state}")
 
-        self.logger.info(f"Exiting at node: {current_node} after {execution_count} executions")
+        self.logger.info("Exiting at node: %s after %s executions", current_node, execution_count)
 
         # Execute exit node if it's a processing node
         if current_node in self.nodes:
             try:
                 state = await asyncio.wait_for(self.nodes[current_node](state), timeout=timeout)
             except asyncio.TimeoutError as e:
-                self.logger.error(f"Exit node {current_node} timed out after {timeout}s")
+                self.logger.error("Exit node %s timed out after %ss", current_node, timeout)
                 raise asyncio.TimeoutError(f"Exit node execution timeout: {current_node}") from e
-
-        return state
+            yield current_node, state
 
 # Example usage
 class MyState(BaseModel):
@@ -0,0 +1,50 @@
+"""Shared aiohttp session for outbound HTTP calls.
+
+A single pooled session keeps TCP/TLS connections alive between requests
+instead of opening a new one per call. aiohttp sessions are bound to the
+event loop they were created on, so a new session is created when the
+running loop changes (e.g. separate ``asyncio.run`` invocations).
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import aiohttp
+
+from tron_ai.utils.io import json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=60)
+
+_client: Optional[aiohttp.ClientSession] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_client() -> aiohttp.ClientSession:
+    """Returns the shared session for the running event loop."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.closed or _client_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            keepalive_timeout=60.0,
+            ttl_dns_cache=300,
+        )
+        _client = aiohttp.ClientSession(
+            connector=connector, timeout=DEFAULT_TIMEOUT, json_serialize=json.dumps
+        )
+        _client_loop = loop
+        logger.debug("Created shared HTTP session")
+    return _client
+
+
+async def close_client() -> None:
+    """Closes the shared session if it belongs to the running event loop."""
+    global _client, _client_loop
+    if _client is not None and not _client.closed and _client_loop is asyncio.get_running_loop():
+        await _client.close()
+    _client = None
+    _client_loop = None
@@ -1,5 +1,6 @@
 # Standard library imports
-from typing import Optional, Any, TYPE_CHECKING, List
+from typing import Optional, Any, TYPE_CHECKING, Dict, List
+import asyncio
 import logging
 import pprint
 from datetime import datetime, timedelta
@@ -112,6 +113,9 @@ class LLMClient(Component):
         # Caching settings
         self._response_cache = {}
         self._cache_ttl = timedelta(minutes=10)
+        # Output format examples by class. Reusing one example keeps the system
+        # prompt byte-identical across calls so provider prefix caching applies.
+        self._format_str_cache: dict[type, str] = {}
 
         # Memory management settings
         self._max_accumulated_results = 50
@@ -169,13 +173,19 @@ class LLMClient(Component):
         Returns:
             JSON string representation of the format
         """
+        format_str = self._format_str_cache.get(output_format_class)
+        if format_str is not None:
+            return format_str
+
         # Lazy import
         from polyfactory.factories.pydantic_factory import ModelFactory
         
         class GenericFactory(ModelFactory[output_format_class]):
             pass
 
-        return GenericFactory().build().model_dump_json()
+        format_str = GenericFactory().build().model_dump_json()
+        self._format_str_cache[output_format_class] = format_str
+        return format_str
 
     def _generate_example_format_string(self, output_format_class: type) -> str:
         """Generate example format string for output formatting.
@@ -330,6 +340,55 @@ class LLMClient(Component):
             prompt_kwargs
         )
 
+    async def acall(
+        self, user_query: str, system_prompt: Prompt, prompt_kwargs: dict = {}
+    ) -> Any:
+        """Async variant of `call`.
+
+        The underlying generator and tool loop are synchronous, so the call runs
+        in a worker thread. Concurrent awaits overlap their LLM round-trips
+        instead of blocking the event loop.
+        """
+        return await asyncio.to_thread(
+            self.call, user_query, system_prompt, prompt_kwargs
+        )
+
+    async def abatch_call(
+        self,
+        user_queries: List[str],
+        system_prompt: Prompt,
+        prompt_kwargs: dict = {},
+    ) -> List[Any]:
+        """Runs `call` for several queries sharing one system prompt concurrently.
+
+        The model clients used here have no synchronous batch endpoint (provider
+        batch APIs complete offline), so the calls are issued concurrently and
+        their round-trips overlap.
+
+        Returns:
+            The responses, in the same order as `user_queries`.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.acall(user_query, system_prompt, prompt_kwargs)
+                    for user_query in user_queries
+                )
+            )
+        )
+
+    async def afcall(
+        self,
+        user_query: str,
+        system_prompt: Prompt,
+        tool_manager: Optional['ToolManager'] = None,
+        prompt_kwargs: dict = {},
+    ) -> Any:
+        """Async variant of `fcall`, run in a worker thread like `acall`."""
+        return await asyncio.to_thread(
+            self.fcall, user_query, system_prompt, tool_manager, prompt_kwargs
+        )
+
     def _prepare_tool_prompt_kwargs(
         self, tool_manager: 'ToolManager', output_data_class: type
     ) -> dict:
@@ -897,10 +956,8 @@ def get_llm_client(
     Returns:
         LLMClient: An instance of the LLM client.
     """
-    # Lazy import OpenAIClient only when needed
     if client is None:
-        from adalflow import OpenAIClient
-        client = OpenAIClient()
+        client = get_model_client("openai")
 
     config = LLMClientConfig(
         model_name=model_name, json_output=json_output, logging=logging
@@ -908,21 +965,36 @@ def get_llm_client(
 
     return LLMClient(client=client, config=config)
 
-def get_llm_client_from_config(config: LLMClientConfig, client: Optional['ModelClient'] = None, client_name: str = "openai") -> "LLMClient":
-    # Lazy import OpenAIClient only when needed
+_model_clients: Dict[str, 'ModelClient'] = {}
+
+
+def get_model_client(client_name: str = "openai") -> 'ModelClient':
+    """Returns the process-wide model client for a provider.
+
+    Each model client owns the provider SDK client and its HTTP connection
+    pool, so LLMClients share one per provider instead of each opening
+    their own connections.
+    """
+    client = _model_clients.get(client_name)
     if client is None:
-        from adalflow import OpenAIClient
-        from adalflow import GroqAPIClient
-        from adalflow.components.model_client.xai_client import XAIClient
-        
+        # Lazy import provider clients only when needed
         if client_name == "groq":
+            from adalflow import GroqAPIClient
             client = GroqAPIClient()
         elif client_name == "xai":
+            from adalflow.components.model_client.xai_client import XAIClient
             client = XAIClient()
         else:
+            from adalflow import OpenAIClient
             client = OpenAIClient()
-        
+        _model_clients[client_name] = client
+    return client
+
+
+def get_llm_client_from_config(config: LLMClientConfig, client: Optional['ModelClient'] = None, client_name: str = "openai") -> "LLMClient":
     """Get an LLMClient instance from a config."""
+    if client is None:
+        client = get_model_client(client_name)
     return LLMClient(client=client, config=config)
 
 def extract_json_from_string(s: str) -> dict:
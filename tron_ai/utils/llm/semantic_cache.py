@@ -0,0 +1,143 @@
+"""Similarity-based cache for LLM completions.
+
+Completions are stored under a namespace derived from the model and system
+prompt, so only calls that would be answered the same way share entries.
+Within a namespace, a query is a hit when its embedding's cosine similarity
+to a stored query reaches the cache threshold.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from tron_ai.models.prompts import Prompt
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+
+# Loaded models by name; None marks a model that could not be loaded
+_embedders: Dict[str, Any] = {}
+_embedders_lock = threading.Lock()
+
+
+def _get_embedder(model_name: str):
+    """Returns the sentence-transformers model, or None if unavailable. Blocks while loading."""
+    with _embedders_lock:
+        if model_name in _embedders:
+            return _embedders[model_name]
+        try:
+            # Lazy import: loading the model pulls in torch
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            embedder = None
+        else:
+            try:
+                embedder = SentenceTransformer(model_name, cache_folder=".cache/sentence_transformers")
+            except Exception as e:
+                logger.warning("Embedding model %s unavailable, semantic cache disabled: %s", model_name, e)
+                embedder = None
+        _embedders[model_name] = embedder
+        return embedder
+
+
+async def embed_texts(texts: List[str], model_name: str = _DEFAULT_EMBEDDING_MODEL):
+    """Embeds texts as normalized vectors, or returns None if no model is available."""
+    if model_name in _embedders:
+        embedder = _embedders[model_name]
+    else:
+        # The first call imports torch and loads the model, which takes seconds
+        embedder = await asyncio.to_thread(_get_embedder, model_name)
+    if embedder is None:
+        return None
+    return await asyncio.to_thread(embedder.encode, texts, normalize_embeddings=True)
+
+
+class SemanticCache:
+    """An in-memory cache that returns responses for near-duplicate queries.
+
+    Args:
+        threshold: Minimum cosine similarity for a stored query to count as a hit.
+        ttl: Seconds an entry stays valid.
+        max_entries: Entries kept per namespace; the oldest are evicted first.
+        model_name: The sentence-transformers model used to embed queries.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        ttl: float = 3600.0,
+        max_entries: int = 256,
+        model_name: str = _DEFAULT_EMBEDDING_MODEL,
+    ):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.model_name = model_name
+        self.hits = 0
+        self.misses = 0
+        # namespace -> [(embedding, response, expires_at)], oldest first
+        self._entries: Dict[str, List[Tuple[Any, Any, float]]] = {}
+
+    @staticmethod
+    def namespace(model: str, prompt: Prompt) -> str:
+        """Builds the namespace for calls with a given model and system prompt."""
+        output_format = getattr(prompt.output_format, "__name__", str(prompt.output_format))
+        key = f"{model}\x00{prompt.text}\x00{output_format}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    async def _embed(self, text: str):
+        embeddings = await embed_texts([text], self.model_name)
+        return None if embeddings is None else embeddings[0]
+
+    async def get(self, namespace: str, query: str) -> Optional[Any]:
+        """Returns the response cached for the closest matching query, if any."""
+        entries = self._entries.get(namespace)
+        if not entries:
+            self.misses += 1
+            return None
+        embedding = await self._embed(query)
+        if embedding is None:
+            self.misses += 1
+            return None
+
+        now = time.monotonic()
+        entries[:] = [entry for entry in entries if entry[2] > now]
+        best_score, best_response = 0.0, None
+        for cached_embedding, response, _ in entries:
+            # Embeddings are normalized, so the dot product is the cosine similarity
+            score = float(embedding @ cached_embedding)
+            if score > best_score:
+                best_score, best_response = score, response
+
+        if best_response is not None and best_score >= self.threshold:
+            self.hits += 1
+            logger.debug("Semantic cache hit (similarity %.3f)", best_score)
+            return best_response
+        self.misses += 1
+        return None
+
+    async def put(self, namespace: str, query: str, response: Any) -> None:
+        """Stores a response for a query."""
+        embedding = await self._embed(query)
+        if embedding is None:
+            return
+        entries = self._entries.setdefault(namespace, [])
+        entries.append((embedding, response, time.monotonic() + self.ttl))
+        if len(entries) > self.max_entries:
+            del entries[0]
+
+
+_semantic_cache = None
+
+
+def get_semantic_cache() -> SemanticCache:
+    """Returns the process-wide semantic cache."""
+    global _semantic_cache
+    if _semantic_cache is None:
+        _semantic_cache = SemanticCache()
+    return _semantic_cache
@@ -0,0 +1,67 @@
+"""Token-aware helpers for bounding text that is inserted into prompts."""
+
+from functools import lru_cache
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used when no tokenizer is available
+_APPROX_CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model_name: str):
+    """Returns the tiktoken encoding for a model, or None if unavailable."""
+    try:
+        # Lazy import: tiktoken is pulled in by adalflow and loads encoding files
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning("Tokenizer unavailable for %s, approximating: %s", model_name, e)
+        return None
+
+
+def truncate_tokens(
+    text: str, max_tokens: int, model_name: str = "gpt-4o", head_ratio: float = 0.6
+) -> str:
+    """Truncates text to a token budget, keeping its head and tail.
+
+    Args:
+        text: The text to bound.
+        max_tokens: The maximum number of tokens to keep. Values <= 0 disable truncation.
+        model_name: The model whose tokenizer is used to count tokens.
+        head_ratio: The share of the budget kept from the start of the text; the
+            rest is kept from the end.
+
+    Returns:
+        The text unchanged if it fits, otherwise its head and tail joined by a
+        marker giving the number of dropped tokens.
+    """
+    # A token always spans at least one character, so short text fits as is
+    if max_tokens <= 0 or len(text) <= max_tokens:
+        return text
+
+    head_count = int(max_tokens * head_ratio)
+    tail_count = max_tokens - head_count
+
+    encoding = _get_encoding(model_name)
+    if encoding is None:
+        max_chars = max_tokens * _APPROX_CHARS_PER_TOKEN
+        if len(text) <= max_chars:
+            return text
+        head_chars = head_count * _APPROX_CHARS_PER_TOKEN
+        tail_chars = max_chars - head_chars
+        dropped = (len(text) - max_chars) // _APPROX_CHARS_PER_TOKEN
+        return f"{text[:head_chars]}\n...[truncated {dropped} tokens]...\n{text[len(text) - tail_chars:]}"
+
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    head = encoding.decode(tokens[:head_count])
+    tail = encoding.decode(tokens[len(tokens) - tail_count:])
+    return f"{head}\n...[truncated {len(tokens) - max_tokens} tokens]...\n{tail}"